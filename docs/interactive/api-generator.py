@@ -4,16 +4,45 @@ ECScope Interactive API Generator
 Generates interactive API documentation with live code examples and real-time performance data
 """
 
-import json
+from __future__ import annotations
+
+import importlib
+import logging
 import os
 import re
-import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-import xml.etree.ElementTree as ET
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Sequence, Tuple, Union
+from dataclasses import dataclass, field, fields, is_dataclass
+
+# Heavier and optional dependencies are imported on first use, so importing
+# this module for its helpers stays cheap
+
+@lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """Import an optional dependency on first use; None when it is not installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+logger = logging.getLogger('ecscope.docs')
 
-@dataclass
+@lru_cache(maxsize=1)
+def _configure_logging() -> None:
+    """Buffer progress messages and write them in one flush at the end of a
+    run (or immediately on errors)"""
+    import logging.handlers
+    
+    logger.setLevel(logging.INFO)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=stream_handler))
+
+@dataclass(slots=True)
 class InteractiveExample:
     """Interactive code example with execution capabilities"""
     title: str
@@ -22,76 +51,263 @@ class InteractiveExample:
     expected_output: str
     performance_notes: str
     difficulty: str = "beginner"  # beginner, intermediate, advanced
-    concepts: List[str] = None
-    related_apis: List[str] = None
+    concepts: List[str] = field(default_factory=list)
+    related_apis: List[str] = field(default_factory=list)
     executable: bool = True
-    
-    def __post_init__(self):
-        if self.concepts is None:
-            self.concepts = []
-        if self.related_apis is None:
-            self.related_apis = []
 
-@dataclass
+@dataclass(slots=True)
 class APIMethod:
     """Enhanced API method with interactive features"""
     name: str
     signature: str
     description: str
-    parameters: List[Dict[str, str]]
     return_type: str
-    examples: List[InteractiveExample]
-    performance_info: Dict[str, Any]
+    parameters: List[Dict[str, str]] = field(default_factory=list)
+    examples: Sequence[InteractiveExample] = ()  # shared empty sentinel, no per-instance list
+    performance_info: Dict[str, Any] = field(default_factory=dict)
     complexity: str = "O(1)"
     thread_safety: str = "thread_safe"
     since_version: str = "1.0.0"
     deprecation_info: Optional[str] = None
-    
-    def __post_init__(self):
-        if not self.examples:
-            self.examples = []
-        if not self.performance_info:
-            self.performance_info = {}
 
-@dataclass
+@dataclass(slots=True)
 class APIClass:
     """Enhanced API class with interactive documentation"""
     name: str
     description: str
     namespace: str
-    template_parameters: List[str]
-    inheritance: List[str]
-    methods: List[APIMethod]
-    examples: List[InteractiveExample]
-    performance_characteristics: Dict[str, Any]
-    memory_layout: Dict[str, Any]
-    use_cases: List[str]
+    template_parameters: List[str] = field(default_factory=list)
+    inheritance: List[str] = field(default_factory=list)
+    methods: List[APIMethod] = field(default_factory=list)
+    examples: Sequence[InteractiveExample] = ()  # shared empty sentinel, no per-instance list
+    performance_characteristics: Dict[str, Any] = field(default_factory=dict)
+    memory_layout: Dict[str, Any] = field(default_factory=dict)
+    use_cases: List[str] = field(default_factory=list)
+
+# C++ sources for the interactive examples live next to this script so they are
+# loaded once per process and shared by every generated artifact
+_EXAMPLES_DIR = Path(__file__).resolve().parent / "examples"
+_EXAMPLE_NAMES = (
+    "registry_create_entity",
+    "registry_bulk_create_entity",
+    "registry_add_component_migration",
+    "arena_vs_malloc",
+)
+_CODE: Dict[str, str] = {
+    name: (_EXAMPLES_DIR / f"{name}.cpp").read_text(encoding='utf-8').rstrip('\n')
+    for name in _EXAMPLE_NAMES
+}
+
+# Field names per dataclass type, resolved once instead of on every serialization
+_FIELDS_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+def _to_plain(obj: Any) -> Any:
+    """Convert API dataclasses to JSON-ready dicts/lists.
+
+    Unlike dataclasses.asdict this does not deep-copy leaf values; strings,
+    numbers and None are returned as-is.
+    """
+    cls = type(obj)
+    if is_dataclass(cls):
+        names = _FIELDS_CACHE.get(cls)
+        if names is None:
+            names = _FIELDS_CACHE[cls] = tuple(f.name for f in fields(cls))
+        return {name: _to_plain(getattr(obj, name)) for name in names}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(item) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _to_plain(value) for key, value in obj.items()}
+    return obj
+
+def _json_default(obj: Any) -> Any:
+    """Fallback hook so API dataclasses and read-only mappings can be handed to the encoder"""
+    if is_dataclass(type(obj)):
+        return _to_plain(obj)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps_indented(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON"""
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        # orjson encodes dataclasses natively, without building intermediate dicts
+        return orjson.dumps(data, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    import json
+    return json.dumps(data, default=_json_default, indent=2,
+                      ensure_ascii=False).encode('utf-8')
+
+def _dumps_compact(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON"""
+    orjson = _optional_module("orjson")
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    import json
+    return json.dumps(data, default=_json_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+def _write_json_stream(path: Path, items: Iterable[Tuple[str, Any]]) -> None:
+    """Write a JSON object member by member, serializing each value as it is produced"""
+    with open(path, 'wb') as f:
+        separator = b'{'
+        for key, value in items:
+            # Join each member's fragments into one buffer and write it once
+            f.write(b''.join((separator, _dumps_compact(key), b':', _dumps_compact(value))))
+            separator = b','
+        f.write(b'{}' if separator == b'{' else b'}')
+
+# Example classification bits, derived from keywords in the example source
+HAS_PROFILING = 1 << 0
+HAS_PHYSICS = 1 << 1
+HAS_GRAPHICS = 1 << 2
+HAS_BENCHMARK = 1 << 3
+HAS_FILE_IO = 1 << 4
+
+_EXAMPLE_KEYWORDS: Mapping[str, int] = MappingProxyType({
+    "performance": HAS_PROFILING,
+    "profiler": HAS_PROFILING,
+    "physics": HAS_PHYSICS,
+    "graphics": HAS_GRAPHICS,
+    "renderer": HAS_GRAPHICS,
+    "benchmark": HAS_BENCHMARK,
+    "file": HAS_FILE_IO,
+    "std::ifstream": HAS_FILE_IO,
+})
+# The lookahead reports overlapping hits too ("profiler" also contains "file"),
+# so one scan answers every substring check the helpers below make. Matching
+# case-insensitively avoids a lowered copy of the whole source; ASCII folding
+# keeps every hit a valid key once lowered.
+_EXAMPLE_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _EXAMPLE_KEYWORDS) + "))",
+    re.IGNORECASE | re.ASCII,
+)
+
+@lru_cache(maxsize=256)
+def _classify_code(code: str) -> int:
+    """HAS_* bitmask for an example's source, found in a single pass"""
+    flags = 0
+    for keyword in _EXAMPLE_KEYWORDS_RE.findall(code):
+        flags |= _EXAMPLE_KEYWORDS[keyword.lower()]
+    return flags
+
+# Flag groups composed by _compile_flags
+_BASE_FLAGS = ("-std=c++20", "-O2", "-I../include")
+_PROFILING_FLAGS = ("-DECSCOPE_ENABLE_PROFILING", "-lprofiler")
+_PHYSICS_FLAGS = ("-DECSCOPE_ENABLE_PHYSICS",)
+_GRAPHICS_FLAGS = ("-DECSCOPE_ENABLE_GRAPHICS", "-lSDL2", "-lGL")
+
+@lru_cache(maxsize=8)
+def _compile_flags(has_profiling: bool, has_physics: bool, has_graphics: bool) -> Tuple[str, ...]:
+    """Compilation flags for a feature combination; one shared tuple per combination"""
+    return (_BASE_FLAGS
+            + (_PROFILING_FLAGS if has_profiling else ())
+            + (_PHYSICS_FLAGS if has_physics else ())
+            + (_GRAPHICS_FLAGS if has_graphics else ()))
+
+def _compile_flags_for_code(code: str) -> Tuple[str, ...]:
+    """Compilation flags implied by an example's source"""
+    flags = _classify_code(code)
+    return _compile_flags(
+        bool(flags & HAS_PROFILING),
+        bool(flags & HAS_PHYSICS),
+        bool(flags & HAS_GRAPHICS),
+    )
+
+@lru_cache(maxsize=256)
+def _runtime_requirements_for_code(code: str) -> Tuple[Tuple[str, Any], ...]:
+    """Runtime limits implied by an example's source (memoized per source)"""
+    requirements = {
+        "memory_limit": "64MB",
+        "time_limit": "5s",
+        "network_access": False,
+        "file_system_access": False
+    }
+    flags = _classify_code(code)
+    
+    # Adjust based on example content
+    if flags & HAS_BENCHMARK or len(code) > 1000:
+        requirements["memory_limit"] = "256MB"
+        requirements["time_limit"] = "10s"
+    
+    if flags & HAS_FILE_IO:
+        requirements["file_system_access"] = True
+    
+    return tuple(requirements.items())
+
+# An output file and either its complete contents or a file to copy verbatim
+Artifact = Tuple[Path, Union[bytes, Path]]
+
+# Static pages shipped as files next to this script and copied as-is
+_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+_PLAYGROUND_TEMPLATE = _TEMPLATES_DIR / "playground.html"
+
+def _sources_mtime() -> float:
+    """Newest modification time among the generator's inputs (this script, examples, templates)"""
+    paths = [Path(__file__)]
+    for directory in (_EXAMPLES_DIR, _TEMPLATES_DIR):
+        if directory.is_dir():
+            paths.extend(directory.iterdir())
+    return max(path.stat().st_mtime for path in paths)
+
+# Only Linux can sendfile() into a regular file; macOS and the BSDs require
+# the output to be a socket
+_FILE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file, kernel-side with sendfile where the platform supports it"""
+    if not _FILE_SENDFILE:
+        import shutil
+        shutil.copyfile(src, dst)
+        return
+    with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+        remaining = os.fstat(src_file.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(dst_file.fileno(), src_file.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+def _write_brotli_variant(path: Path, data: bytes) -> None:
+    """Write a pre-compressed .br copy next to an output, for servers that serve it directly"""
+    brotli = _optional_module("brotli")
+    path.with_name(path.name + ".br").write_bytes(brotli.compress(data, quality=11))
+
+def _write_artifact(artifact: Artifact) -> None:
+    """Write one artifact to disk, plus a Brotli-compressed .br variant when available.
+
+    File-backed artifacts are never read into memory: their .br variant is
+    copied from a precompressed sibling (e.g. playground.html.br) if one
+    ships next to the source, and skipped otherwise.
+    """
+    path, content = artifact
+    if isinstance(content, Path):
+        _copy_file(content, path)
+        precompressed = content.with_name(content.name + ".br")
+        if precompressed.is_file():
+            _copy_file(precompressed, path.with_name(path.name + ".br"))
+        return
     
-    def __post_init__(self):
-        if not self.template_parameters:
-            self.template_parameters = []
-        if not self.inheritance:
-            self.inheritance = []
-        if not self.methods:
-            self.methods = []
-        if not self.examples:
-            self.examples = []
-        if not self.performance_characteristics:
-            self.performance_characteristics = {}
-        if not self.memory_layout:
-            self.memory_layout = {}
-        if not self.use_cases:
-            self.use_cases = []
+    path.write_bytes(content)
+    if _optional_module("brotli") is not None:
+        _write_brotli_variant(path, content)
 
 class InteractiveAPIGenerator:
     """Generates interactive API documentation for ECScope"""
     
-    def __init__(self, project_root: str, output_dir: str):
+    def __init__(self, project_root: str, output_dir: str, force: bool = False):
         self.project_root = Path(project_root)
         self.output_dir = Path(output_dir)
+        _configure_logging()
         self.include_path = self.project_root / "include" / "ecscope"
         self.examples_path = self.project_root / "examples"
         
+        # Create output directories once up front rather than per artifact
+        (self.output_dir / "data").mkdir(parents=True, exist_ok=True)
+        (self.output_dir / "styles").mkdir(parents=True, exist_ok=True)
+        
         # Enhanced API data structures
         self.api_classes = {}
         self.api_functions = {}
@@ -104,53 +320,68 @@ class InteractiveAPIGenerator:
             "enable_performance_visualization": True,
             "generate_live_examples": True,
             "include_assembly_output": False,
-            "real_time_profiling": True
+            "real_time_profiling": True,
+            "force_regeneration": force
         }
+        
+        # Every artifact is derived from these inputs only
+        self.sources_mtime = _sources_mtime()
 
     def generate_interactive_api_docs(self):
         """Generate complete interactive API documentation"""
-        print("🚀 Generating Interactive API Documentation...")
+        logger.info("🚀 Generating Interactive API Documentation...")
         
-        # Parse enhanced API data
-        self.parse_enhanced_api_data()
-        
-        # Generate interactive examples
-        self.generate_live_examples()
-        
-        # Generate performance visualizations
-        self.generate_performance_visualizations()
-        
-        # Generate interactive API browser
-        self.generate_api_browser()
-        
-        # Generate code playground
-        self.generate_code_playground()
-        
-        # Generate real-time performance dashboard
-        self.generate_performance_dashboard()
-        
-        print("✅ Interactive API documentation generated!")
+        try:
+            # Parse enhanced API data
+            self.parse_enhanced_api_data()
+            
+            # Generate interactive examples (streamed straight to disk)
+            self.generate_live_examples()
+            
+            artifacts: List[Artifact] = []
+            
+            # Generate performance visualizations
+            artifacts.extend(self.generate_performance_visualizations())
+            
+            # Generate interactive API browser
+            artifacts.extend(self.generate_api_browser())
+            
+            # Generate code playground
+            artifacts.extend(self.generate_code_playground())
+            
+            # Generate real-time performance dashboard
+            artifacts.extend(self.generate_performance_dashboard())
+            
+            # Write everything in one batch
+            self.write_artifacts(artifacts)
+            
+            logger.info("✅ Interactive API documentation generated!")
+        finally:
+            for handler in logger.handlers:
+                handler.flush()
 
     def parse_enhanced_api_data(self):
         """Parse API data with enhanced information"""
-        print("📖 Parsing enhanced API data...")
+        logger.info("📖 Parsing enhanced API data...")
         
         # Load performance benchmarks
         self.load_performance_benchmarks()
         
-        # Parse core ECS classes
-        self.parse_ecs_classes()
+        # The class parsers (core ECS, memory management, physics, rendering)
+        # are independent and return disjoint class tables, so run them together
+        parsers = [
+            self.parse_ecs_classes,
+            self.parse_memory_classes,
+            self.parse_physics_classes,
+            self.parse_rendering_classes,
+        ]
+        from concurrent.futures import ThreadPoolExecutor
         
-        # Parse memory management classes
-        self.parse_memory_classes()
-        
-        # Parse physics classes
-        self.parse_physics_classes()
-        
-        # Parse rendering classes
-        self.parse_rendering_classes()
+        with ThreadPoolExecutor(max_workers=len(parsers)) as executor:
+            for classes in executor.map(lambda parse: parse(), parsers):
+                self.api_classes.update(classes)
 
-    def parse_ecs_classes(self):
+    def parse_ecs_classes(self) -> Dict[str, APIClass]:
         """Parse ECS-related classes with enhanced information"""
         # Registry class
         registry_class = APIClass(
@@ -177,21 +408,7 @@ class InteractiveAPIGenerator:
                         InteractiveExample(
                             title="Basic Entity Creation",
                             description="Create entities and observe ID assignment",
-                            code="""#include <ecscope/ecs.hpp>
-#include <iostream>
-
-int main() {
-    ecscope::ecs::Registry registry;
-    
-    // Create multiple entities
-    for (int i = 0; i < 5; ++i) {
-        auto entity = registry.create_entity();
-        std::cout << "Created entity: " << entity << std::endl;
-    }
-    
-    std::cout << "Total entities: " << registry.entity_count() << std::endl;
-    return 0;
-}""",
+                            code=_CODE["registry_create_entity"],
                             expected_output="""Created entity: 0
 Created entity: 1
 Created entity: 2
@@ -205,30 +422,7 @@ Total entities: 5""",
                         InteractiveExample(
                             title="Performance Test: Bulk Entity Creation",
                             description="Measure entity creation performance at scale",
-                            code="""#include <ecscope/ecs.hpp>
-#include <ecscope/core/time.hpp>
-#include <iostream>
-
-int main() {
-    ecscope::ecs::Registry registry;
-    
-    const int entity_count = 100000;
-    
-    auto start = ecscope::high_resolution_now();
-    
-    for (int i = 0; i < entity_count; ++i) {
-        registry.create_entity();
-    }
-    
-    auto duration = ecscope::duration_since(start);
-    
-    std::cout << "Created " << entity_count << " entities in " 
-              << duration << " microseconds" << std::endl;
-    std::cout << "Average time per entity: " 
-              << (duration / entity_count) << " us" << std::endl;
-    
-    return 0;
-}""",
+                            code=_CODE["registry_bulk_create_entity"],
                             expected_output="""Created 100000 entities in 450 microseconds
 Average time per entity: 0.0045 us""",
                             performance_notes="Bulk creation shows excellent scalability due to pool allocation",
@@ -257,31 +451,7 @@ Average time per entity: 0.0045 us""",
                         InteractiveExample(
                             title="Component Addition and Archetype Migration",
                             description="See how adding components triggers archetype changes",
-                            code="""#include <ecscope/ecs.hpp>
-#include <ecscope/components/transform.hpp>
-#include <ecscope/components/velocity.hpp>
-#include <ecscope/debug/archetype_analyzer.hpp>
-
-int main() {
-    ecscope::ecs::Registry registry;
-    ecscope::debug::ArchetypeAnalyzer analyzer(registry);
-    
-    auto entity = registry.create_entity();
-    std::cout << "Initial archetypes: " << analyzer.archetype_count() << std::endl;
-    
-    // Add first component - creates new archetype
-    registry.add_component<Transform>(entity, Transform{});
-    std::cout << "After Transform: " << analyzer.archetype_count() << " archetypes" << std::endl;
-    
-    // Add second component - migrates to new archetype
-    registry.add_component<Velocity>(entity, Velocity{1.0f, 0.0f, 0.0f});
-    std::cout << "After Velocity: " << analyzer.archetype_count() << " archetypes" << std::endl;
-    
-    // Show archetype composition
-    analyzer.print_archetype_info();
-    
-    return 0;
-}""",
+                            code=_CODE["registry_add_component_migration"],
                             expected_output="""Initial archetypes: 1
 After Transform: 2 archetypes
 After Velocity: 3 archetypes
@@ -314,12 +484,12 @@ Archetype 2: [Transform, Velocity]""",
                 "High-performance component queries",
                 "Data-oriented design patterns"
             ],
-            examples=[]  # Class-level examples would go here
+            examples=()  # Class-level examples would go here
         )
         
-        self.api_classes["Registry"] = registry_class
+        return {"Registry": registry_class}
 
-    def parse_memory_classes(self):
+    def parse_memory_classes(self) -> Dict[str, APIClass]:
         """Parse memory management classes"""
         # Arena Allocator
         arena_class = APIClass(
@@ -349,50 +519,7 @@ Archetype 2: [Transform, Velocity]""",
                         InteractiveExample(
                             title="Arena vs Standard Allocator Performance",
                             description="Compare allocation performance between arena and malloc",
-                            code="""#include <ecscope/memory/arena.hpp>
-#include <ecscope/core/profiler.hpp>
-#include <memory>
-
-int main() {
-    const size_t arena_size = 1024 * 1024; // 1MB
-    const size_t allocation_size = 64;
-    const int iterations = 10000;
-    
-    // Test Arena allocator
-    ecscope::memory::Arena arena(arena_size);
-    ecscope::Profiler profiler;
-    
-    profiler.begin_section("arena_allocation");
-    for (int i = 0; i < iterations; ++i) {
-        void* ptr = arena.allocate(allocation_size);
-        // Use the memory to prevent optimization
-        *static_cast<int*>(ptr) = i;
-    }
-    auto arena_time = profiler.end_section("arena_allocation");
-    
-    // Test standard allocator
-    profiler.begin_section("malloc_allocation");
-    std::vector<void*> ptrs;
-    ptrs.reserve(iterations);
-    
-    for (int i = 0; i < iterations; ++i) {
-        void* ptr = malloc(allocation_size);
-        *static_cast<int*>(ptr) = i;
-        ptrs.push_back(ptr);
-    }
-    auto malloc_time = profiler.end_section("malloc_allocation");
-    
-    // Cleanup
-    for (void* ptr : ptrs) {
-        free(ptr);
-    }
-    
-    std::cout << "Arena:  " << arena_time << " microseconds" << std::endl;
-    std::cout << "Malloc: " << malloc_time << " microseconds" << std::endl;
-    std::cout << "Speedup: " << (malloc_time / arena_time) << "x" << std::endl;
-    
-    return 0;
-}""",
+                            code=_CODE["arena_vs_malloc"],
                             expected_output="""Arena:  28 microseconds
 Malloc: 450 microseconds
 Speedup: 16.1x""",
@@ -423,51 +550,79 @@ Speedup: 16.1x""",
                 "String processing",
                 "Parsing and compilation"
             ],
-            examples=[]
+            examples=()
         )
         
-        self.api_classes["Arena"] = arena_class
+        return {"Arena": arena_class}
 
     def generate_live_examples(self):
         """Generate live, executable examples"""
-        print("💡 Generating live examples...")
+        logger.info("💡 Generating live examples...")
         
-        examples_data = {}
+        output_file = self.output_dir / "data" / "live_examples.json"
+        if self.outputs_up_to_date(output_file):
+            return
         
-        # Generate examples for each API class
-        for class_name, api_class in self.api_classes.items():
-            class_examples = []
-            
-            # Add method examples
-            for method in api_class.methods:
-                for example in method.examples:
-                    class_examples.append({
-                        "id": f"{class_name}_{method.name}_{len(class_examples)}",
-                        "title": example.title,
-                        "description": example.description,
-                        "code": example.code,
-                        "expected_output": example.expected_output,
-                        "performance_notes": example.performance_notes,
-                        "difficulty": example.difficulty,
-                        "concepts": example.concepts,
-                        "related_apis": example.related_apis,
-                        "executable": example.executable,
-                        "compile_flags": self.get_compile_flags_for_example(example),
-                        "runtime_requirements": self.get_runtime_requirements(example)
-                    })
-            
-            examples_data[class_name] = class_examples
+        # Stream one class at a time so only a single class' examples are
+        # materialized at once
+        _write_json_stream(output_file, (
+            (class_name, self.collect_live_examples(class_name, api_class))
+            for class_name, api_class in self.api_classes.items()
+        ))
+        if _optional_module("brotli") is not None:
+            _write_brotli_variant(output_file, output_file.read_bytes())
+
+    def collect_live_examples(self, class_name: str, api_class: APIClass) -> List[Dict[str, Any]]:
+        """Build the live example entries for one API class"""
+        class_examples = []
         
-        # Save examples data
-        output_file = self.output_dir / "data" / "live_examples.json"
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # Add method examples
+        for method in api_class.methods:
+            for example in method.examples:
+                class_examples.append({
+                    "id": f"{class_name}_{method.name}_{len(class_examples)}",
+                    "title": example.title,
+                    "description": example.description,
+                    "code": example.code,
+                    "expected_output": example.expected_output,
+                    "performance_notes": example.performance_notes,
+                    "difficulty": example.difficulty,
+                    "concepts": example.concepts,
+                    "related_apis": example.related_apis,
+                    "executable": example.executable,
+                    "compile_flags": self.get_compile_flags_for_example(example),
+                    "runtime_requirements": self.get_runtime_requirements(example)
+                })
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(examples_data, f, indent=2)
+        return class_examples
 
-    def generate_performance_visualizations(self):
+    def outputs_up_to_date(self, *paths: Path) -> bool:
+        """True when every output exists and is newer than all generator inputs"""
+        if self.config["force_regeneration"]:
+            return False
+        try:
+            return all(path.stat().st_mtime >= self.sources_mtime for path in paths)
+        except OSError:
+            return False
+
+    def write_artifacts(self, artifacts: List[Artifact]) -> None:
+        """Write rendered artifacts concurrently (file I/O and Brotli release the GIL)"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        for parent in {path.parent for path, _ in artifacts}:
+            parent.mkdir(parents=True, exist_ok=True)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # list() surfaces the first write error, if any
+            list(executor.map(_write_artifact, artifacts))
+
+    def generate_performance_visualizations(self) -> List[Artifact]:
         """Generate performance visualization data"""
-        print("⚡ Generating performance visualizations...")
+        logger.info("⚡ Generating performance visualizations...")
+        
+        output_file = self.output_dir / "data" / "performance_visualizations.json"
+        if self.outputs_up_to_date(output_file):
+            return []
         
         perf_viz_data = {}
         
@@ -483,10 +638,9 @@ Speedup: 16.1x""",
         # Generate comparison charts
         perf_viz_data["comparisons"] = self.generate_comparison_data()
         
-        # Save visualization data
-        output_file = self.output_dir / "data" / "performance_visualizations.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(perf_viz_data, f, indent=2)
+        # Save visualization data; it is only consumed by the charts, so skip
+        # pretty-printing
+        return [(output_file, _dumps_compact(perf_viz_data))]
 
     def generate_scaling_data(self) -> Dict[str, Any]:
         """Generate performance scaling data"""
@@ -569,255 +723,130 @@ Speedup: 16.1x""",
             }
         }
 
-    def generate_api_browser(self):
+    def generate_api_browser(self) -> List[Artifact]:
         """Generate interactive API browser"""
-        print("🌐 Generating API browser...")
-        
-        # Create API browser HTML
-        browser_html = self.create_api_browser_template()
-        
-        # Create API data structure for browser
-        api_data = {}
-        for class_name, api_class in self.api_classes.items():
-            api_data[class_name] = asdict(api_class)
+        logger.info("🌐 Generating API browser...")
         
-        # Save API browser
-        with open(self.output_dir / "api_browser.html", 'w', encoding='utf-8') as f:
-            f.write(browser_html)
+        browser_file = self.output_dir / "api_browser.html"
+        data_file = self.output_dir / "data" / "api_data.json"
+        if self.outputs_up_to_date(browser_file, data_file):
+            return []
         
-        # Save API data
-        with open(self.output_dir / "data" / "api_data.json", 'w', encoding='utf-8') as f:
-            json.dump(api_data, f, indent=2)
+        # API browser page plus its data; the class objects are serialized in
+        # place rather than first being copied into a parallel dict tree
+        return [
+            (browser_file, _API_BROWSER_HTML),
+            (data_file, _dumps_indented(self.api_classes)),
+        ]
 
-    def create_api_browser_template(self) -> str:
-        """Create API browser HTML template"""
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ECScope API Browser</title>
-    <link rel="stylesheet" href="styles/main.css">
-    <link rel="stylesheet" href="styles/api-browser.css">
-</head>
-<body>
-    <div class="api-browser">
-        <header class="browser-header">
-            <h1>ECScope API Browser</h1>
-            <div class="search-container">
-                <input type="text" id="api-search" placeholder="Search APIs, methods, examples...">
-                <div class="search-filters">
-                    <label><input type="checkbox" value="classes" checked> Classes</label>
-                    <label><input type="checkbox" value="methods" checked> Methods</label>
-                    <label><input type="checkbox" value="examples" checked> Examples</label>
-                </div>
-            </div>
-        </header>
-        
-        <div class="browser-content">
-            <nav class="api-navigation">
-                <div class="nav-section">
-                    <h3>Namespaces</h3>
-                    <div id="namespace-tree"></div>
-                </div>
-                
-                <div class="nav-section">
-                    <h3>Categories</h3>
-                    <ul class="category-list">
-                        <li><a href="#core" class="category-link">Core ECS</a></li>
-                        <li><a href="#memory" class="category-link">Memory Management</a></li>
-                        <li><a href="#physics" class="category-link">Physics</a></li>
-                        <li><a href="#rendering" class="category-link">Rendering</a></li>
-                        <li><a href="#performance" class="category-link">Performance</a></li>
-                    </ul>
-                </div>
-            </nav>
-            
-            <main class="api-details">
-                <div id="api-content">
-                    <div class="welcome-message">
-                        <h2>Welcome to ECScope API Browser</h2>
-                        <p>Select a class or function from the navigation to see detailed documentation with live examples.</p>
-                    </div>
-                </div>
-            </main>
-            
-            <aside class="api-sidebar">
-                <div class="sidebar-section">
-                    <h3>Quick Actions</h3>
-                    <button id="run-example" class="action-button" disabled>
-                        <i class="fas fa-play"></i> Run Example
-                    </button>
-                    <button id="open-playground" class="action-button">
-                        <i class="fas fa-code"></i> Open Playground
-                    </button>
-                    <button id="view-source" class="action-button" disabled>
-                        <i class="fas fa-eye"></i> View Source
-                    </button>
-                </div>
-                
-                <div class="sidebar-section">
-                    <h3>Performance Info</h3>
-                    <div id="performance-summary">
-                        Select an API to see performance characteristics
-                    </div>
-                </div>
-                
-                <div class="sidebar-section">
-                    <h3>Related APIs</h3>
-                    <div id="related-apis">
-                        Select an API to see related functions and classes
-                    </div>
-                </div>
-            </aside>
-        </div>
-    </div>
-    
-    <script src="scripts/api-browser.js"></script>
-</body>
-</html>"""
-
-    def generate_code_playground(self):
+    def generate_code_playground(self) -> List[Artifact]:
         """Generate interactive code playground"""
-        print("🎮 Generating code playground...")
+        logger.info("🎮 Generating code playground...")
         
-        playground_html = self.create_playground_template()
-        
-        with open(self.output_dir / "playground.html", 'w', encoding='utf-8') as f:
-            f.write(playground_html)
+        playground_file = self.output_dir / "playground.html"
+        examples_file = self.output_dir / "data" / "playground_examples.json"
+        if self.outputs_up_to_date(playground_file, examples_file):
+            return []
         
         # Generate playground examples
         playground_examples = self.create_playground_examples()
         
-        with open(self.output_dir / "data" / "playground_examples.json", 'w', encoding='utf-8') as f:
-            json.dump(playground_examples, f, indent=2)
+        return [
+            (playground_file, _PLAYGROUND_TEMPLATE),
+            (examples_file, _dumps_indented(playground_examples)),
+        ]
 
-    def create_playground_template(self) -> str:
-        """Create code playground HTML template"""
-        return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ECScope Code Playground</title>
-    <link rel="stylesheet" href="styles/main.css">
-    <link rel="stylesheet" href="styles/playground.css">
-</head>
-<body>
-    <div class="playground">
-        <header class="playground-header">
-            <h1>ECScope Code Playground</h1>
-            <div class="header-controls">
-                <select id="example-selector">
-                    <option value="">Select an example...</option>
-                </select>
-                <button id="run-code" class="run-button">
-                    <i class="fas fa-play"></i> Run Code
-                </button>
-                <button id="share-code" class="share-button">
-                    <i class="fas fa-share"></i> Share
-                </button>
-            </div>
-        </header>
+    def create_playground_examples(self) -> Mapping[str, Any]:
+        """Create examples for the playground (shared, read-only)"""
+        return _PLAYGROUND_EXAMPLES
+
+    def get_compile_flags_for_example(self, example: InteractiveExample) -> Tuple[str, ...]:
+        """Get compilation flags needed for an example (shared, immutable)"""
+        return _compile_flags_for_code(example.code)
+
+    def get_runtime_requirements(self, example: InteractiveExample) -> Dict[str, Any]:
+        """Get runtime requirements for an example"""
+        return dict(_runtime_requirements_for_code(example.code))
+
+    def generate_performance_dashboard(self) -> List[Artifact]:
+        """Generate real-time performance dashboard"""
+        logger.info("📊 Generating performance dashboard...")
         
-        <div class="playground-content">
-            <div class="editor-panel">
-                <div class="editor-tabs">
-                    <button class="tab-button active" data-tab="main">main.cpp</button>
-                    <button class="tab-button" data-tab="output">Output</button>
-                    <button class="tab-button" data-tab="performance">Performance</button>
-                </div>
-                
-                <div class="tab-content active" id="main">
-                    <div id="code-editor"></div>
-                </div>
-                
-                <div class="tab-content" id="output">
-                    <div class="output-console">
-                        <div class="console-header">
-                            <span>Program Output</span>
-                            <button id="clear-output">Clear</button>
-                        </div>
-                        <div class="console-content" id="console-output">
-                            Ready to run code...
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="tab-content" id="performance">
-                    <div class="performance-panel">
-                        <div class="metrics-grid">
-                            <div class="metric-card">
-                                <h4>Execution Time</h4>
-                                <div class="metric-value" id="execution-time">-</div>
-                            </div>
-                            <div class="metric-card">
-                                <h4>Memory Used</h4>
-                                <div class="metric-value" id="memory-usage">-</div>
-                            </div>
-                            <div class="metric-card">
-                                <h4>Cache Misses</h4>
-                                <div class="metric-value" id="cache-misses">-</div>
-                            </div>
-                        </div>
-                        
-                        <div class="performance-chart">
-                            <canvas id="performance-graph"></canvas>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="results-panel">
-                <div class="panel-header">
-                    <h3>Execution Results</h3>
-                    <div class="execution-status" id="execution-status">Ready</div>
-                </div>
-                
-                <div class="results-content">
-                    <div class="compilation-output">
-                        <h4>Compilation</h4>
-                        <pre id="compilation-log">No compilation output</pre>
-                    </div>
-                    
-                    <div class="runtime-output">
-                        <h4>Runtime Output</h4>
-                        <pre id="runtime-log">No runtime output</pre>
-                    </div>
-                    
-                    <div class="performance-output">
-                        <h4>Performance Analysis</h4>
-                        <div id="performance-analysis">
-                            Run code to see performance analysis
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
+        dashboard_file = self.output_dir / "performance_dashboard.html"
+        if self.outputs_up_to_date(dashboard_file):
+            return []
         
-        <div class="playground-footer">
-            <div class="help-text">
-                <p>💡 Tip: Try modifying the code and see how it affects performance!</p>
-            </div>
-            <div class="compiler-info">
-                <span>Compiler: GCC 11.2 | Standard: C++20 | Optimization: -O2</span>
-            </div>
-        </div>
-    </div>
-    
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/monaco-editor/0.40.0/min/vs/loader.min.js"></script>
-    <script src="scripts/playground.js"></script>
-</body>
-</html>"""
+        return [(dashboard_file, _DASHBOARD_HTML)]
+
+    def generate_cache_analysis_data(self) -> Dict[str, Any]:
+        """Generate cache behavior analysis data"""
+        return {
+            "soa_vs_aos": {
+                "description": "Cache performance comparison between SoA and AoS layouts",
+                "test_scenarios": [
+                    {
+                        "name": "Sequential Transform Update",
+                        "soa_cache_misses": 156,
+                        "aos_cache_misses": 2840,
+                        "entity_count": 10000,
+                        "explanation": "SoA layout keeps all Transform components together, maximizing cache locality"
+                    },
+                    {
+                        "name": "Mixed Component Access",
+                        "soa_cache_misses": 892,
+                        "aos_cache_misses": 3420,
+                        "entity_count": 10000,
+                        "explanation": "Even with mixed access, SoA maintains better cache behavior"
+                    }
+                ]
+            },
+            "archetype_migration": {
+                "description": "Cache impact of archetype migrations",
+                "migration_costs": [
+                    {"entities": 100, "cache_misses": 12, "time_us": 5},
+                    {"entities": 1000, "cache_misses": 185, "time_us": 48},
+                    {"entities": 10000, "cache_misses": 2100, "time_us": 520}
+                ]
+            }
+        }
 
-    def create_playground_examples(self) -> Dict[str, Any]:
-        """Create examples for the playground"""
+    def generate_comparison_data(self) -> Dict[str, Any]:
+        """Generate comparison data for different approaches"""
         return {
-            "basic_examples": [
-                {
-                    "title": "Hello ECScope",
-                    "description": "Your first ECScope program",
-                    "code": """#include <ecscope/ecs.hpp>
+            "ecs_vs_oop": {
+                "description": "Performance comparison between ECS and traditional OOP approaches",
+                "metrics": [
+                    {
+                        "operation": "Update 10k entities",
+                        "ecs_time": 0.8,  # ms
+                        "oop_time": 3.2,  # ms
+                        "speedup": 4.0
+                    },
+                    {
+                        "operation": "Query entities by component",
+                        "ecs_time": 0.1,  # ms
+                        "oop_time": 1.8,  # ms  
+                        "speedup": 18.0
+                    }
+                ]
+            },
+            "allocator_comparison": {
+                "description": "Memory allocator performance comparison",
+                "allocators": [
+                    {"name": "malloc", "speed": 1.0, "fragmentation": 0.25, "cache_friendliness": 0.3},
+                    {"name": "Arena", "speed": 15.0, "fragmentation": 0.0, "cache_friendliness": 0.95},
+                    {"name": "Pool", "speed": 8.0, "fragmentation": 0.0, "cache_friendliness": 0.85}
+                ]
+            }
+        }
+
+# Playground starter programs, built once and shared read-only
+_PLAYGROUND_EXAMPLES: Mapping[str, Tuple[Mapping[str, str], ...]] = MappingProxyType({
+    "basic_examples": (
+        MappingProxyType({
+            "title": "Hello ECScope",
+            "description": "Your first ECScope program",
+            "code": """#include <ecscope/ecs.hpp>
 #include <iostream>
 
 int main() {
@@ -828,11 +857,11 @@ int main() {
     
     return 0;
 }"""
-                },
-                {
-                    "title": "Component System Basics",
-                    "description": "Working with components and systems",
-                    "code": """#include <ecscope/ecs.hpp>
+        }),
+        MappingProxyType({
+            "title": "Component System Basics",
+            "description": "Working with components and systems",
+            "code": """#include <ecscope/ecs.hpp>
 #include <ecscope/components/transform.hpp>
 #include <ecscope/components/velocity.hpp>
 #include <iostream>
@@ -861,13 +890,13 @@ int main() {
     
     return 0;
 }"""
-                }
-            ],
-            "performance_examples": [
-                {
-                    "title": "Memory Allocation Comparison",
-                    "description": "Compare different allocation strategies",
-                    "code": """#include <ecscope/memory/arena.hpp>
+        }),
+    ),
+    "performance_examples": (
+        MappingProxyType({
+            "title": "Memory Allocation Comparison",
+            "description": "Compare different allocation strategies",
+            "code": """#include <ecscope/memory/arena.hpp>
 #include <ecscope/memory/pool.hpp>
 #include <ecscope/core/profiler.hpp>
 #include <vector>
@@ -924,67 +953,109 @@ int main() {
     
     return 0;
 }"""
-                }
-            ]
-        }
-
-    def get_compile_flags_for_example(self, example: InteractiveExample) -> List[str]:
-        """Get compilation flags needed for an example"""
-        flags = ["-std=c++20", "-O2", "-I../include"]
-        
-        # Add specific flags based on example content
-        if "performance" in example.code.lower() or "profiler" in example.code.lower():
-            flags.extend(["-DECSCOPE_ENABLE_PROFILING", "-lprofiler"])
-        
-        if "physics" in example.code.lower():
-            flags.append("-DECSCOPE_ENABLE_PHYSICS")
-        
-        if "graphics" in example.code.lower() or "renderer" in example.code.lower():
-            flags.extend(["-DECSCOPE_ENABLE_GRAPHICS", "-lSDL2", "-lGL"])
-        
-        return flags
-
-    def get_runtime_requirements(self, example: InteractiveExample) -> Dict[str, Any]:
-        """Get runtime requirements for an example"""
-        requirements = {
-            "memory_limit": "64MB",
-            "time_limit": "5s",
-            "network_access": False,
-            "file_system_access": False
-        }
-        
-        # Adjust based on example content
-        if "benchmark" in example.code.lower() or len(example.code) > 1000:
-            requirements["memory_limit"] = "256MB"
-            requirements["time_limit"] = "10s"
-        
-        if "file" in example.code.lower() or "std::ifstream" in example.code:
-            requirements["file_system_access"] = True
-        
-        return requirements
+        }),
+    )
+})
 
-    def generate_performance_dashboard(self):
-        """Generate real-time performance dashboard"""
-        print("📊 Generating performance dashboard...")
-        
-        dashboard_html = self.create_dashboard_template()
-        
-        with open(self.output_dir / "performance_dashboard.html", 'w', encoding='utf-8') as f:
-            f.write(dashboard_html)
-
-    def create_dashboard_template(self) -> str:
-        """Create performance dashboard template"""
-        return """<!DOCTYPE html>
+# Static page templates, encoded once at import time. The pages share one
+# document shell: title, page stylesheet, body markup and trailing scripts
+_HTML_SHELL = b"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ECScope Performance Dashboard</title>
+    <title>%b</title>
     <link rel="stylesheet" href="styles/main.css">
-    <link rel="stylesheet" href="styles/dashboard.css">
+    <link rel="stylesheet" href="styles/%b.css">%b
 </head>
 <body>
-    <div class="dashboard">
+%b
+    
+%b
+</body>
+</html>"""
+
+_API_BROWSER_BODY = """    <div class="api-browser">
+        <header class="browser-header">
+            <h1>ECScope API Browser</h1>
+            <div class="search-container">
+                <input type="text" id="api-search" placeholder="Search APIs, methods, examples...">
+                <div class="search-filters">
+                    <label><input type="checkbox" value="classes" checked> Classes</label>
+                    <label><input type="checkbox" value="methods" checked> Methods</label>
+                    <label><input type="checkbox" value="examples" checked> Examples</label>
+                </div>
+            </div>
+        </header>
+        
+        <div class="browser-content">
+            <nav class="api-navigation">
+                <div class="nav-section">
+                    <h3>Namespaces</h3>
+                    <div id="namespace-tree"></div>
+                </div>
+                
+                <div class="nav-section">
+                    <h3>Categories</h3>
+                    <ul class="category-list">
+                        <li><a href="#core" class="category-link">Core ECS</a></li>
+                        <li><a href="#memory" class="category-link">Memory Management</a></li>
+                        <li><a href="#physics" class="category-link">Physics</a></li>
+                        <li><a href="#rendering" class="category-link">Rendering</a></li>
+                        <li><a href="#performance" class="category-link">Performance</a></li>
+                    </ul>
+                </div>
+            </nav>
+            
+            <main class="api-details">
+                <div id="api-content">
+                    <div class="welcome-message">
+                        <h2>Welcome to ECScope API Browser</h2>
+                        <p>Select a class or function from the navigation to see detailed documentation with live examples.</p>
+                    </div>
+                </div>
+            </main>
+            
+            <aside class="api-sidebar">
+                <div class="sidebar-section">
+                    <h3>Quick Actions</h3>
+                    <button id="run-example" class="action-button" disabled>
+                        <i class="fas fa-play"></i> Run Example
+                    </button>
+                    <button id="open-playground" class="action-button">
+                        <i class="fas fa-code"></i> Open Playground
+                    </button>
+                    <button id="view-source" class="action-button" disabled>
+                        <i class="fas fa-eye"></i> View Source
+                    </button>
+                </div>
+                
+                <div class="sidebar-section">
+                    <h3>Performance Info</h3>
+                    <div id="performance-summary">
+                        Select an API to see performance characteristics
+                    </div>
+                </div>
+                
+                <div class="sidebar-section">
+                    <h3>Related APIs</h3>
+                    <div id="related-apis">
+                        Select an API to see related functions and classes
+                    </div>
+                </div>
+            </aside>
+        </div>
+    </div>""".encode('utf-8')
+
+_API_BROWSER_HTML = _HTML_SHELL % (
+    b"ECScope API Browser",
+    b"api-browser",
+    b"",
+    _API_BROWSER_BODY,
+    b'    <script src="scripts/api-browser.js"></script>',
+)
+
+_DASHBOARD_BODY = """    <div class="dashboard">
         <header class="dashboard-header">
             <h1>ECScope Performance Dashboard</h1>
             <div class="connection-status">
@@ -1033,74 +1104,62 @@ int main() {
                 </div>
             </div>
         </div>
-    </div>
-    
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="scripts/dashboard.js"></script>
-</body>
-</html>"""
+    </div>""".encode('utf-8')
 
-    def generate_cache_analysis_data(self) -> Dict[str, Any]:
-        """Generate cache behavior analysis data"""
-        return {
-            "soa_vs_aos": {
-                "description": "Cache performance comparison between SoA and AoS layouts",
-                "test_scenarios": [
-                    {
-                        "name": "Sequential Transform Update",
-                        "soa_cache_misses": 156,
-                        "aos_cache_misses": 2840,
-                        "entity_count": 10000,
-                        "explanation": "SoA layout keeps all Transform components together, maximizing cache locality"
-                    },
-                    {
-                        "name": "Mixed Component Access",
-                        "soa_cache_misses": 892,
-                        "aos_cache_misses": 3420,
-                        "entity_count": 10000,
-                        "explanation": "Even with mixed access, SoA maintains better cache behavior"
-                    }
-                ]
-            },
-            "archetype_migration": {
-                "description": "Cache impact of archetype migrations",
-                "migration_costs": [
-                    {"entities": 100, "cache_misses": 12, "time_us": 5},
-                    {"entities": 1000, "cache_misses": 185, "time_us": 48},
-                    {"entities": 10000, "cache_misses": 2100, "time_us": 520}
-                ]
-            }
-        }
-
-    def generate_comparison_data(self) -> Dict[str, Any]:
-        """Generate comparison data for different approaches"""
-        return {
-            "ecs_vs_oop": {
-                "description": "Performance comparison between ECS and traditional OOP approaches",
-                "metrics": [
-                    {
-                        "operation": "Update 10k entities",
-                        "ecs_time": 0.8,  # ms
-                        "oop_time": 3.2,  # ms
-                        "speedup": 4.0
-                    },
-                    {
-                        "operation": "Query entities by component",
-                        "ecs_time": 0.1,  # ms
-                        "oop_time": 1.8,  # ms  
-                        "speedup": 18.0
-                    }
-                ]
-            },
-            "allocator_comparison": {
-                "description": "Memory allocator performance comparison",
-                "allocators": [
-                    {"name": "malloc", "speed": 1.0, "fragmentation": 0.25, "cache_friendliness": 0.3},
-                    {"name": "Arena", "speed": 15.0, "fragmentation": 0.0, "cache_friendliness": 0.95},
-                    {"name": "Pool", "speed": 8.0, "fragmentation": 0.0, "cache_friendliness": 0.85}
-                ]
+_DASHBOARD_HTML = _HTML_SHELL % (
+    b"ECScope Performance Dashboard",
+    b"dashboard",
+    # Fetch Chart.js while the body is still being parsed. scheduleUpdate
+    # coalesces DOM writes into one animation frame; dashboard.js routes every
+    # metric update through it, e.g. scheduleUpdate(() => el.textContent = v)
+    b'''
+    <link rel="preload" as="script" href="https://cdn.jsdelivr.net/npm/chart.js">
+    <script>
+        window.scheduleUpdate = (() => {
+            let queue = new Set(), pending = false;
+            return fn => {
+                queue.add(fn);
+                if (pending) return;
+                pending = true;
+                requestAnimationFrame(() => {
+                    const batch = queue;
+                    queue = new Set();
+                    pending = false;
+                    batch.forEach(update => update());
+                });
+            };
+        })();
+    </script>''',
+    _DASHBOARD_BODY,
+    # logActivity keeps the activity log bounded and appends each frame's
+    # new entries in a single DOM insertion
+    b'''    <script>
+        (() => {
+            const LOG_MAX = 200;
+            const log = document.getElementById('activity-log');
+            let pending = [];
+            function flush() {
+                const fragment = document.createDocumentFragment();
+                for (const message of pending) {
+                    const entry = document.createElement('div');
+                    entry.className = 'log-entry';
+                    entry.textContent = message;
+                    fragment.appendChild(entry);
+                }
+                pending = [];
+                log.appendChild(fragment);
+                while (log.childElementCount > LOG_MAX) log.firstElementChild.remove();
             }
-        }
+            window.logActivity = message => {
+                pending.push(message);
+                if (pending.length > LOG_MAX) pending.shift();
+                scheduleUpdate(flush);
+            };
+        })();
+    </script>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js" defer></script>
+    <script src="scripts/dashboard.js" defer></script>''',
+)
 
 def main():
     import argparse
@@ -1108,10 +1167,12 @@ def main():
     parser = argparse.ArgumentParser(description='Generate interactive ECScope API documentation')
     parser.add_argument('project_root', help='Path to ECScope project root')
     parser.add_argument('--output', default='docs/interactive', help='Output directory')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate artifacts even if they are newer than their inputs')
     
     args = parser.parse_args()
     
-    generator = InteractiveAPIGenerator(args.project_root, args.output)
+    generator = InteractiveAPIGenerator(args.project_root, args.output, force=args.force)
     generator.generate_interactive_api_docs()
 
 if __name__ == '__main__':
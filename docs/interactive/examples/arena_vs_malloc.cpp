@@ -0,0 +1,44 @@
+#include <ecscope/memory/arena.hpp>
+#include <ecscope/core/profiler.hpp>
+#include <memory>
+
+int main() {
+    const size_t arena_size = 1024 * 1024; // 1MB
+    const size_t allocation_size = 64;
+    const int iterations = 10000;
+    
+    // Test Arena allocator
+    ecscope::memory::Arena arena(arena_size);
+    ecscope::Profiler profiler;
+    
+    profiler.begin_section("arena_allocation");
+    for (int i = 0; i < iterations; ++i) {
+        void* ptr = arena.allocate(allocation_size);
+        // Use the memory to prevent optimization
+        *static_cast<int*>(ptr) = i;
+    }
+    auto arena_time = profiler.end_section("arena_allocation");
+    
+    // Test standard allocator
+    profiler.begin_section("malloc_allocation");
+    std::vector<void*> ptrs;
+    ptrs.reserve(iterations);
+    
+    for (int i = 0; i < iterations; ++i) {
+        void* ptr = malloc(allocation_size);
+        *static_cast<int*>(ptr) = i;
+        ptrs.push_back(ptr);
+    }
+    auto malloc_time = profiler.end_section("malloc_allocation");
+    
+    // Cleanup
+    for (void* ptr : ptrs) {
+        free(ptr);
+    }
+    
+    std::cout << "Arena:  " << arena_time << " microseconds" << std::endl;
+    std::cout << "Malloc: " << malloc_time << " microseconds" << std::endl;
+    std::cout << "Speedup: " << (malloc_time / arena_time) << "x" << std::endl;
+    
+    return 0;
+}
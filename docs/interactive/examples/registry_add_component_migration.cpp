@@ -0,0 +1,25 @@
+#include <ecscope/ecs.hpp>
+#include <ecscope/components/transform.hpp>
+#include <ecscope/components/velocity.hpp>
+#include <ecscope/debug/archetype_analyzer.hpp>
+
+int main() {
+    ecscope::ecs::Registry registry;
+    ecscope::debug::ArchetypeAnalyzer analyzer(registry);
+    
+    auto entity = registry.create_entity();
+    std::cout << "Initial archetypes: " << analyzer.archetype_count() << std::endl;
+    
+    // Add first component - creates new archetype
+    registry.add_component<Transform>(entity, Transform{});
+    std::cout << "After Transform: " << analyzer.archetype_count() << " archetypes" << std::endl;
+    
+    // Add second component - migrates to new archetype
+    registry.add_component<Velocity>(entity, Velocity{1.0f, 0.0f, 0.0f});
+    std::cout << "After Velocity: " << analyzer.archetype_count() << " archetypes" << std::endl;
+    
+    // Show archetype composition
+    analyzer.print_archetype_info();
+    
+    return 0;
+}
@@ -0,0 +1,24 @@
+#include <ecscope/ecs.hpp>
+#include <ecscope/core/time.hpp>
+#include <iostream>
+
+int main() {
+    ecscope::ecs::Registry registry;
+    
+    const int entity_count = 100000;
+    
+    auto start = ecscope::high_resolution_now();
+    
+    for (int i = 0; i < entity_count; ++i) {
+        registry.create_entity();
+    }
+    
+    auto duration = ecscope::duration_since(start);
+    
+    std::cout << "Created " << entity_count << " entities in " 
+              << duration << " microseconds" << std::endl;
+    std::cout << "Average time per entity: " 
+              << (duration / entity_count) << " us" << std::endl;
+    
+    return 0;
+}
@@ -0,0 +1,15 @@
+#include <ecscope/ecs.hpp>
+#include <iostream>
+
+int main() {
+    ecscope::ecs::Registry registry;
+    
+    // Create multiple entities
+    for (int i = 0; i < 5; ++i) {
+        auto entity = registry.create_entity();
+        std::cout << "Created entity: " << entity << std::endl;
+    }
+    
+    std::cout << "Total entities: " << registry.entity_count() << std::endl;
+    return 0;
+}
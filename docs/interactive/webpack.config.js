@@ -11,7 +11,11 @@ module.exports = (env, argv) => {
     output: {
       path: path.resolve(__dirname, 'dist'),
       filename: isDevelopment ? '[name].js' : '[name].[contenthash].js',
-      clean: true,
+      // Keep the outputs build-docs.py writes next to the bundle (and its
+      // incremental build cache); the API generator may still be running
+      clean: {
+        keep: /^(\.build-cache|generated|tutorials|examples)\//
+      },
       publicPath: '/'
     },
     
@@ -26,12 +26,274 @@ import json
 import argparse
 import statistics
 import os
+import re
+import sys
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional, without it each benchmark file is parsed in one buffer
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional, the statistics fall back to plain Python loops
+    np = None
+
+try:
+    import numba
+except ImportError:  # optional JIT, the numeric kernels then run as plain Python
+    numba = None
+
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+_by_change = attrgetter('change_percentage')
+
+# Test-name substring -> system category. Each branch scans the whole name
+# before the next is tried, so "ecs" wins over "memory" wherever they appear
+_TEST_CATEGORY_RE = re.compile(
+    r'(?:.*?(?P<ECS>ecs)|.*?(?P<Memory>memory)|.*?(?P<Physics>physics))',
+    re.IGNORECASE | re.ASCII | re.DOTALL)
+
+# Regression/improvement table row: the result, the change sign, the change
+# and the confidence as percentages. Bound once, fields read by attribute
+_REPORT_ROW = ("| {0.test_name} | {0.baseline_performance:.2f} | {0.current_performance:.2f} | "
+               "{1}{2:.1f}% | {3:.0f}% |\n").format
+
+# Where benchmark records live inside a top-level JSON object, by precedence
+_ITEM_PREFIXES = ('benchmarks.item', 'results.item')
+
+def _intern(value: Any) -> Any:
+    """Intern repeated name strings so lookup keys compare by identity"""
+    return sys.intern(value) if type(value) is str else value
+
+def _parse_json(data: bytes) -> Any:
+    """Parse a raw JSON buffer, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; the stdlib parser also accepts the
+            # NaN/Infinity literals some benchmark harnesses emit
+            pass
+    return json.loads(data)
+
+def _benchmark_items(data: Any) -> List[Any]:
+    """Pick the benchmark records out of a fully parsed document"""
+    # Handle different JSON formats
+    if isinstance(data, list):
+        return data
+    elif 'benchmarks' in data:
+        return data['benchmarks']
+    elif 'results' in data:
+        return data['results']
+    else:
+        return [data]  # Single result
+
+def _stream_benchmark_items(f) -> Iterator[Any]:
+    """Yield benchmark records one at a time from an open binary JSON file"""
+    events = ijson.parse(f, use_float=True)
+    streamed = 0
+    try:
+        _, event, _ = next(events)
+        if event == 'start_array':
+            for item in ijson.items(events, 'item'):
+                streamed += 1
+                yield item
+            return
+        if event != 'start_map':
+            raise ValueError('not a benchmark container')
+        
+        # Records under "benchmarks" are yielded as soon as each one closes;
+        # "results" only counts when there is no "benchmarks" key, so hold
+        # those back until the whole object has been seen
+        keys = set()
+        deferred = []
+        builder = None
+        for prefix, event, value in events:
+            if builder is not None:
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                if depth:
+                    continue
+                item = builder.value
+                builder = None
+            elif prefix == '' and event == 'map_key':
+                keys.add(value)
+                continue
+            elif prefix not in _ITEM_PREFIXES:
+                continue
+            elif event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+                target = prefix
+                continue
+            else:
+                item, target = value, prefix
+            
+            if target == _ITEM_PREFIXES[0]:
+                streamed += 1
+                yield item
+            else:
+                deferred.append(item)
+    except (ijson.JSONError, ValueError):
+        # ijson rejects the NaN/Infinity literals and single-record
+        # documents are not worth streaming; re-read the buffer instead and
+        # carry on after the records that were already handed out
+        f.seek(0)
+        yield from _benchmark_items(_parse_json(f.read()))[streamed:]
+        return
+    
+    if 'benchmarks' not in keys:
+        if 'results' in keys:
+            yield from deferred
+        else:
+            f.seek(0)
+            yield _parse_json(f.read())  # Single result
+
+def _njit(**options):
+    """numba.njit(**options) when numba is installed, otherwise a no-op decorator"""
+    if numba is None:
+        return lambda func: func
+    return numba.njit(**options)
+
+_prange = numba.prange if numba is not None else range
+
+@_njit(parallel=True, fastmath={'nsz', 'contract'}, cache=True)
+def _significance_kernel(base_perf, cur_perf, base_std, cur_std, threshold):
+    """Per-pair change, significance, confidence and flag in one parallel loop.
+    fastmath is limited to nsz/contract: the reciprocal and NaN shortcuts would
+    reorder near-tied regressions and could flag NaN timings"""
+    n = base_perf.shape[0]
+    change = np.empty(n)
+    significance = np.empty(n)
+    confidence = np.empty(n)
+    flagged = np.empty(n, dtype=np.bool_)
+    for i in _prange(n):
+        baseline_perf = base_perf[i]
+        current_perf = cur_perf[i]
+        change_percentage = (current_perf - baseline_perf) / baseline_perf
+        baseline_cv = base_std[i] / baseline_perf if baseline_perf > 0 else 0.0
+        current_cv = cur_std[i] / current_perf if current_perf > 0 else 0.0
+        sig = abs(change_percentage) / ((baseline_cv * baseline_cv + current_cv * current_cv) ** 0.5 + 1e-10)
+        conf = min(0.99, sig / 3.0)
+        change[i] = change_percentage
+        significance[i] = sig
+        confidence[i] = conf
+        flagged[i] = (change_percentage > threshold or change_percentage < -threshold) and conf > 0.5
+    return change, significance, confidence, flagged
+
+def _regression_stats(pairs: List[Tuple[Any, Any]], threshold: float) -> List[Tuple[int, float, float, float]]:
+    """(index, change, significance, confidence) of the baseline/current pairs
+    whose change crosses the threshold with better than 50% confidence"""
+    if np is not None:
+        base_perf = np.fromiter((b.average_time_us for b, _ in pairs), dtype=np.float64, count=len(pairs))
+        cur_perf = np.fromiter((c.average_time_us for _, c in pairs), dtype=np.float64, count=len(pairs))
+        base_std = np.fromiter((b.std_deviation_us for b, _ in pairs), dtype=np.float64, count=len(pairs))
+        cur_std = np.fromiter((c.std_deviation_us for _, c in pairs), dtype=np.float64, count=len(pairs))
+        
+        if numba is not None:
+            change, significance, confidence, flagged = _significance_kernel(
+                base_perf, cur_perf, base_std, cur_std, threshold)
+            flagged = np.flatnonzero(flagged)
+        else:
+            change = (cur_perf - base_perf) / base_perf
+            base_cv = np.divide(base_std, base_perf, out=np.zeros_like(base_perf), where=base_perf > 0)
+            cur_cv = np.divide(cur_std, cur_perf, out=np.zeros_like(cur_perf), where=cur_perf > 0)
+            significance = np.abs(change) / (np.sqrt(base_cv ** 2 + cur_cv ** 2) + 1e-10)
+            confidence = np.minimum(0.99, significance / 3.0)  # Rough approximation
+            
+            flagged = np.flatnonzero(((change > threshold) | (change < -threshold)) & (confidence > 0.5))
+        return list(zip(flagged.tolist(), change[flagged].tolist(),
+                        significance[flagged].tolist(), confidence[flagged].tolist()))
+    
+    stats = []
+    for i, (baseline_result, current_result) in enumerate(pairs):
+        baseline_perf = baseline_result.average_time_us
+        current_perf = current_result.average_time_us
+        change_percentage = (current_perf - baseline_perf) / baseline_perf
+        
+        # Calculate statistical significance (simplified)
+        baseline_cv = baseline_result.std_deviation_us / baseline_perf if baseline_perf > 0 else 0
+        current_cv = current_result.std_deviation_us / current_perf if current_perf > 0 else 0
+        combined_variance = (baseline_cv ** 2 + current_cv ** 2) ** 0.5
+        
+        statistical_significance = abs(change_percentage) / (combined_variance + 1e-10)
+        confidence_level = min(0.99, statistical_significance / 3.0)  # Rough approximation
+        
+        if (change_percentage > threshold or change_percentage < -threshold) and confidence_level > 0.5:
+            stats.append((i, change_percentage, statistical_significance, confidence_level))
+    return stats
+
+@lru_cache(maxsize=None)
+def _test_category(test_name: str) -> str:
+    """Extract the system category from a test name (simplified)"""
+    match = _TEST_CATEGORY_RE.match(test_name)
+    return match.lastgroup if match else "Other"
+
+def _architecture_times(results) -> Dict[str, List[float]]:
+    """Average times grouped by architecture, in first-seen order"""
+    arch_times = defaultdict(list)
+    for result in results:
+        arch_times[result.architecture].append(result.average_time_us)
+    return arch_times
+
+@_njit(cache=True)
+def _linreg_slope(x, y):
+    """Least-squares slope of y over x, accumulated in a single pass"""
+    n = len(x)
+    sx = sy = sxy = sxx = 0.0
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        sx += xi
+        sy += yi
+        sxy += xi * yi
+        sxx += xi * xi
+    return (n * sxy - sx * sy) / (n * sxx - sx * sx)
+
+def _mean_stdev(values) -> Tuple[float, float]:
+    """Mean and sample standard deviation, the latter 0 for fewer than two values"""
+    if np is not None:
+        arr = np.asarray(values, dtype=np.float64)
+        return float(arr.mean()), float(arr.std(ddof=1)) if arr.size > 1 else 0
+    return statistics.fmean(values), statistics.stdev(values) if len(values) > 1 else 0
+
+def _mean(values) -> float:
+    """Arithmetic mean of a list or NumPy column"""
+    if np is not None:
+        return float(np.mean(values))
+    return statistics.fmean(values)
+
+def _result_columns(results) -> Optional[Dict[str, Any]]:
+    """Struct-of-arrays view of the numeric result fields, None without NumPy"""
+    if np is None:
+        return None
+    count = len(results)
+    return {
+        'time': np.fromiter((r.average_time_us for r in results), dtype=np.float64, count=count),
+        'mem': np.fromiter((r.memory_usage for r in results), dtype=np.int64, count=count),
+        'ent': np.fromiter((r.entity_count for r in results), dtype=np.int64, count=count),
+        'cache': np.fromiter((r.cache_hit_ratio for r in results), dtype=np.float64, count=count),
+    }
+
+@dataclass(slots=True)
 class PerformanceResult:
     """Individual performance benchmark result"""
     test_name: str
@@ -49,7 +311,7 @@ class PerformanceResult:
     platform: str = "unknown"
     build_config: str = "unknown"
 
-@dataclass
+@dataclass(slots=True)
 class RegressionResult:
     """Performance regression analysis result"""
     test_name: str
@@ -80,53 +342,50 @@ class PerformanceAnalyzer:
         self.regression_threshold = regression_threshold
         self.baseline_results: List[PerformanceResult] = []
         self.current_results: List[PerformanceResult] = []
+        self._cols: Optional[Dict[str, Any]] = None
         
-    def load_results(self, file_path: str) -> List[PerformanceResult]:
-        """Load performance results from JSON file"""
+    def load_results(self, file_path: str) -> Iterator[PerformanceResult]:
+        """Stream performance results from a JSON file.
+
+        Records are parsed incrementally but only handed out once the whole
+        file has parsed, so a truncated or corrupt file contributes nothing.
+        """
+        results = []
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            results = []
-            
-            # Handle different JSON formats
-            if isinstance(data, list):
-                benchmark_data = data
-            elif 'benchmarks' in data:
-                benchmark_data = data['benchmarks']
-            elif 'results' in data:
-                benchmark_data = data['results']
-            else:
-                benchmark_data = [data]  # Single result
-            
-            for item in benchmark_data:
-                try:
-                    result = PerformanceResult(
-                        test_name=item.get('name', item.get('test_name', 'Unknown')),
-                        category=item.get('category', 'Unknown'),
-                        architecture=item.get('architecture', item.get('architecture_type', 'Unknown')),
-                        entity_count=int(item.get('entity_count', 0)),
-                        average_time_us=float(item.get('real_time', item.get('average_time_us', 0))),
-                        min_time_us=float(item.get('min_time', item.get('min_time_us', 0))),
-                        max_time_us=float(item.get('max_time', item.get('max_time_us', 0))),
-                        std_deviation_us=float(item.get('stddev', item.get('std_deviation_us', 0))),
-                        entities_per_second=float(item.get('entities_per_second', 0)),
-                        memory_usage=int(item.get('memory_usage', item.get('peak_memory_usage', 0))),
-                        cache_hit_ratio=float(item.get('cache_hit_ratio', 0.0)),
-                        timestamp=item.get('timestamp', datetime.now().isoformat()),
-                        platform=item.get('platform', 'unknown'),
-                        build_config=item.get('build_config', 'unknown')
-                    )
+            with open(file_path, 'rb') as f:
+                if ijson is not None:
+                    benchmark_data = _stream_benchmark_items(f)
+                else:
+                    benchmark_data = _benchmark_items(_parse_json(f.read()))
+                
+                for item in benchmark_data:
+                    try:
+                        result = PerformanceResult(
+                            test_name=_intern(item.get('name', item.get('test_name', 'Unknown'))),
+                            category=item.get('category', 'Unknown'),
+                            architecture=_intern(item.get('architecture', item.get('architecture_type', 'Unknown'))),
+                            entity_count=int(item.get('entity_count', 0)),
+                            average_time_us=float(item.get('real_time', item.get('average_time_us', 0))),
+                            min_time_us=float(item.get('min_time', item.get('min_time_us', 0))),
+                            max_time_us=float(item.get('max_time', item.get('max_time_us', 0))),
+                            std_deviation_us=float(item.get('stddev', item.get('std_deviation_us', 0))),
+                            entities_per_second=float(item.get('entities_per_second', 0)),
+                            memory_usage=int(item.get('memory_usage', item.get('peak_memory_usage', 0))),
+                            cache_hit_ratio=float(item.get('cache_hit_ratio', 0.0)),
+                            timestamp=item.get('timestamp', datetime.now().isoformat()),
+                            platform=item.get('platform', 'unknown'),
+                            build_config=item.get('build_config', 'unknown')
+                        )
+                    except (KeyError, ValueError, TypeError) as e:
+                        print(f"Warning: Failed to parse result item {item}: {e}")
+                        continue
                     results.append(result)
-                except (KeyError, ValueError, TypeError) as e:
-                    print(f"Warning: Failed to parse result item {item}: {e}")
-                    continue
             
-            return results
-            
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+        except (FileNotFoundError,) + _JSON_ERRORS as e:
             print(f"Error loading results from {file_path}: {e}")
-            return []
+            return
+        
+        yield from results
     
     def detect_regressions(self, baseline: List[PerformanceResult], 
                           current: List[PerformanceResult]) -> Tuple[List[RegressionResult], List[RegressionResult]]:
@@ -137,38 +396,30 @@ class PerformanceAnalyzer:
         # Create lookup dictionary for baseline results
         baseline_lookup = {}
         for result in baseline:
-            key = f"{result.test_name}_{result.architecture}_{result.entity_count}"
+            key = (result.test_name, result.architecture, result.entity_count)
             baseline_lookup[key] = result
         
+        pairs = []
         for current_result in current:
-            key = f"{current_result.test_name}_{current_result.architecture}_{current_result.entity_count}"
+            key = (current_result.test_name, current_result.architecture, current_result.entity_count)
             
-            if key not in baseline_lookup:
+            baseline_result = baseline_lookup.get(key)
+            if baseline_result is None:
                 continue  # No baseline to compare against
             
-            baseline_result = baseline_lookup[key]
-            
-            # Calculate performance change
-            baseline_perf = baseline_result.average_time_us
-            current_perf = current_result.average_time_us
-            
-            if baseline_perf == 0:
+            if baseline_result.average_time_us == 0:
                 continue  # Avoid division by zero
             
-            change_percentage = (current_perf - baseline_perf) / baseline_perf
-            
-            # Calculate statistical significance (simplified)
-            baseline_cv = baseline_result.std_deviation_us / baseline_perf if baseline_perf > 0 else 0
-            current_cv = current_result.std_deviation_us / current_perf if current_perf > 0 else 0
-            combined_variance = (baseline_cv ** 2 + current_cv ** 2) ** 0.5
-            
-            statistical_significance = abs(change_percentage) / (combined_variance + 1e-10)
-            confidence_level = min(0.99, statistical_significance / 3.0)  # Rough approximation
-            
+            pairs.append((baseline_result, current_result))
+        
+        # Score every pair in one batch and only materialize the flagged ones
+        for i, change_percentage, statistical_significance, confidence_level in \
+                _regression_stats(pairs, self.regression_threshold):
+            baseline_result, current_result = pairs[i]
             regression_result = RegressionResult(
                 test_name=current_result.test_name,
-                baseline_performance=baseline_perf,
-                current_performance=current_perf,
+                baseline_performance=baseline_result.average_time_us,
+                current_performance=current_result.average_time_us,
                 change_percentage=change_percentage,
                 is_regression=change_percentage > self.regression_threshold,
                 is_improvement=change_percentage < -self.regression_threshold,
@@ -176,58 +427,82 @@ class PerformanceAnalyzer:
                 confidence_level=confidence_level
             )
             
-            if regression_result.is_regression and confidence_level > 0.5:
+            if regression_result.is_regression:
                 regressions.append(regression_result)
-            elif regression_result.is_improvement and confidence_level > 0.5:
+            else:
                 improvements.append(regression_result)
         
         # Sort by magnitude of change
-        regressions.sort(key=lambda x: x.change_percentage, reverse=True)
-        improvements.sort(key=lambda x: x.change_percentage)
+        regressions.sort(key=_by_change, reverse=True)
+        improvements.sort(key=_by_change)
         
         return regressions, improvements
     
-    def analyze_memory_performance(self, results: List[PerformanceResult]) -> Dict[str, Any]:
+    def analyze_memory_performance(self, results: List[PerformanceResult],
+                                   columns: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyze memory usage patterns and efficiency"""
         if not results:
             return {}
         
-        memory_usage = [r.memory_usage for r in results if r.memory_usage > 0]
-        if not memory_usage:
+        if columns is not None:
+            # Mask the prebuilt columns instead of revisiting every result
+            mem_col, ent_col, cache_col = columns['mem'], columns['ent'], columns['cache']
+            has_memory = mem_col > 0
+            per_entity = has_memory & (ent_col > 0)
+            memory_usage = mem_col[has_memory]
+            memory_per_entity = mem_col[per_entity] / ent_col[per_entity]
+            cache_ratios = cache_col[cache_col > 0]
+        else:
+            # Collect every column in one pass over the results
+            memory_usage = []
+            memory_per_entity = []
+            cache_ratios = []
+            for result in results:
+                if result.memory_usage > 0:
+                    memory_usage.append(result.memory_usage)
+                    if result.entity_count > 0:
+                        memory_per_entity.append(result.memory_usage / result.entity_count)
+                if result.cache_hit_ratio > 0:
+                    cache_ratios.append(result.cache_hit_ratio)
+        
+        if not len(memory_usage):
             return {"error": "No memory usage data available"}
         
         # Calculate memory statistics
         analysis = {
             "total_tests": len(results),
             "tests_with_memory_data": len(memory_usage),
-            "min_memory_usage": min(memory_usage),
-            "max_memory_usage": max(memory_usage),
-            "average_memory_usage": statistics.mean(memory_usage),
-            "median_memory_usage": statistics.median(memory_usage),
-            "memory_usage_std": statistics.stdev(memory_usage) if len(memory_usage) > 1 else 0,
         }
+        if np is not None:
+            mem = np.asarray(memory_usage, dtype=np.int64)
+            analysis["min_memory_usage"] = int(mem.min())
+            analysis["max_memory_usage"] = int(mem.max())
+            analysis["average_memory_usage"], analysis["memory_usage_std"] = _mean_stdev(mem)
+            analysis["median_memory_usage"] = float(np.median(mem))
+        else:
+            analysis["min_memory_usage"] = min(memory_usage)
+            analysis["max_memory_usage"] = max(memory_usage)
+            analysis["average_memory_usage"], analysis["memory_usage_std"] = _mean_stdev(memory_usage)
+            analysis["median_memory_usage"] = statistics.median(memory_usage)
         
         # Memory efficiency analysis
-        memory_per_entity = []
-        for result in results:
-            if result.memory_usage > 0 and result.entity_count > 0:
-                memory_per_entity.append(result.memory_usage / result.entity_count)
-        
-        if memory_per_entity:
-            analysis["average_memory_per_entity"] = statistics.mean(memory_per_entity)
-            analysis["memory_efficiency_variance"] = statistics.stdev(memory_per_entity) if len(memory_per_entity) > 1 else 0
+        if len(memory_per_entity):
+            analysis["average_memory_per_entity"], analysis["memory_efficiency_variance"] = \
+                _mean_stdev(memory_per_entity)
         
         # Cache performance analysis
-        cache_ratios = [r.cache_hit_ratio for r in results if r.cache_hit_ratio > 0]
-        if cache_ratios:
-            analysis["average_cache_hit_ratio"] = statistics.mean(cache_ratios)
-            analysis["cache_performance_consistency"] = 1.0 - (statistics.stdev(cache_ratios) if len(cache_ratios) > 1 else 0)
+        if len(cache_ratios):
+            analysis["average_cache_hit_ratio"], cache_std = _mean_stdev(cache_ratios)
+            analysis["cache_performance_consistency"] = 1.0 - cache_std
         
         return analysis
     
     def generate_educational_insights(self, results: List[PerformanceResult], 
                                     regressions: List[RegressionResult],
-                                    improvements: List[RegressionResult]) -> List[str]:
+                                    improvements: List[RegressionResult],
+                                    arch_times: Optional[Dict[str, List[float]]] = None,
+                                    columns: Optional[Dict[str, Any]] = None,
+                                    entity_counts: Optional[List[int]] = None) -> List[str]:
         """Generate educational insights about performance characteristics"""
         insights = []
         
@@ -235,14 +510,10 @@ class PerformanceAnalyzer:
             return ["No performance data available for analysis."]
         
         # Analyze architecture performance differences
-        architectures = {}
-        for result in results:
-            if result.architecture not in architectures:
-                architectures[result.architecture] = []
-            architectures[result.architecture].append(result.average_time_us)
+        architectures = arch_times if arch_times is not None else _architecture_times(results)
         
         if len(architectures) > 1:
-            arch_averages = {arch: statistics.mean(times) for arch, times in architectures.items()}
+            arch_averages = {arch: statistics.fmean(times) for arch, times in architectures.items()}
             best_arch = min(arch_averages, key=arch_averages.get)
             worst_arch = max(arch_averages, key=arch_averages.get)
             
@@ -255,38 +526,47 @@ class PerformanceAnalyzer:
             )
         
         # Analyze scaling characteristics
-        entity_counts = sorted(set(r.entity_count for r in results if r.entity_count > 0))
+        if entity_counts is None:
+            entity_counts = sorted(set(r.entity_count for r in results if r.entity_count > 0))
+        scaling_data = []
         if len(entity_counts) > 2:
-            scaling_data = []
-            for count in entity_counts:
-                count_results = [r for r in results if r.entity_count == count]
-                if count_results:
-                    avg_time = statistics.mean(r.average_time_us for r in count_results)
-                    scaling_data.append((count, avg_time))
-            
-            if len(scaling_data) > 2:
-                # Simple linear regression for scaling analysis
-                n = len(scaling_data)
-                sum_x = sum(x for x, y in scaling_data)
-                sum_y = sum(y for x, y in scaling_data)
-                sum_xy = sum(x * y for x, y in scaling_data)
-                sum_x2 = sum(x * x for x, y in scaling_data)
-                
-                slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+            if columns is not None:
+                # Average time per distinct entity count straight off the columns
+                scaled = columns['ent'] > 0
+                counts, groups = np.unique(columns['ent'][scaled], return_inverse=True)
+                times = np.bincount(groups, weights=columns['time'][scaled]) / np.bincount(groups)
+                scaling_data = list(zip(counts.tolist(), times.tolist()))
+            else:
+                for count in entity_counts:
+                    count_results = [r for r in results if r.entity_count == count]
+                    if count_results:
+                        avg_time = statistics.fmean(r.average_time_us for r in count_results)
+                        scaling_data.append((count, avg_time))
+        
+        if len(scaling_data) > 2:
+            # Simple linear regression for scaling analysis
+            counts, times = zip(*scaling_data)
+            if numba is not None:
+                counts = np.asarray(counts, dtype=np.float64)
+                times = np.asarray(times, dtype=np.float64)
+            slope = _linreg_slope(counts, times)
                 
-                if slope > 0:
-                    complexity_class = "linear" if slope < 2 else "quadratic" if slope < 10 else "exponential"
-                    insights.append(
-                        f"Scaling Analysis: Performance appears to scale {complexity_class}ly with entity count "
-                        f"(slope: {slope:.3f}). This suggests the ECS implementation maintains good "
-                        f"cache locality and avoids algorithmic bottlenecks."
-                    )
+            if slope > 0:
+                complexity_class = "linear" if slope < 2 else "quadratic" if slope < 10 else "exponential"
+                insights.append(
+                    f"Scaling Analysis: Performance appears to scale {complexity_class}ly with entity count "
+                    f"(slope: {slope:.3f}). This suggests the ECS implementation maintains good "
+                    f"cache locality and avoids algorithmic bottlenecks."
+                )
         
         # Memory usage insights
-        memory_results = [r for r in results if r.memory_usage > 0]
-        if memory_results:
-            avg_memory = statistics.mean(r.memory_usage for r in memory_results)
-            max_memory = max(r.memory_usage for r in memory_results)
+        if columns is not None:
+            memory_usage = columns['mem'][columns['mem'] > 0]
+        else:
+            memory_usage = [r.memory_usage for r in results if r.memory_usage > 0]
+        if len(memory_usage):
+            avg_memory = _mean(memory_usage)
+            max_memory = int(max(memory_usage))
             
             if max_memory > avg_memory * 2:
                 insights.append(
@@ -297,7 +577,7 @@ class PerformanceAnalyzer:
         
         # Regression insights
         if regressions:
-            worst_regression = max(regressions, key=lambda x: x.change_percentage)
+            worst_regression = max(regressions, key=_by_change)
             insights.append(
                 f"Performance Regression Alert: {worst_regression.test_name} shows a "
                 f"{worst_regression.change_percentage * 100:.1f}% performance degradation. "
@@ -306,7 +586,7 @@ class PerformanceAnalyzer:
         
         # Improvement insights  
         if improvements:
-            best_improvement = min(improvements, key=lambda x: x.change_percentage)
+            best_improvement = min(improvements, key=_by_change)
             insights.append(
                 f"Performance Improvement: {best_improvement.test_name} shows a "
                 f"{abs(best_improvement.change_percentage) * 100:.1f}% performance improvement. "
@@ -317,7 +597,10 @@ class PerformanceAnalyzer:
     
     def generate_optimization_recommendations(self, results: List[PerformanceResult],
                                            regressions: List[RegressionResult],
-                                           memory_analysis: Dict[str, Any]) -> List[str]:
+                                           memory_analysis: Dict[str, Any],
+                                           arch_times: Optional[Dict[str, List[float]]] = None,
+                                           columns: Optional[Dict[str, Any]] = None,
+                                           entity_counts: Optional[List[int]] = None) -> List[str]:
         """Generate specific optimization recommendations"""
         recommendations = []
         
@@ -344,10 +627,7 @@ class PerformanceAnalyzer:
         if regressions:
             regression_categories = {}
             for reg in regressions:
-                # Extract category from test name (simplified)
-                category = "ECS" if "ecs" in reg.test_name.lower() else \
-                          "Memory" if "memory" in reg.test_name.lower() else \
-                          "Physics" if "physics" in reg.test_name.lower() else "Other"
+                category = _test_category(reg.test_name)
                 
                 if category not in regression_categories:
                     regression_categories[category] = []
@@ -355,7 +635,7 @@ class PerformanceAnalyzer:
             
             for category, regs in regression_categories.items():
                 if len(regs) > 1:
-                    avg_regression = statistics.mean(r.change_percentage for r in regs)
+                    avg_regression = statistics.fmean(r.change_percentage for r in regs)
                     recommendations.append(
                         f"{category} System Optimization: Multiple regressions detected "
                         f"(avg: {avg_regression * 100:.1f}%). Review recent changes to "
@@ -364,14 +644,10 @@ class PerformanceAnalyzer:
                     )
         
         # Architecture-specific recommendations
-        arch_performance = {}
-        for result in results:
-            if result.architecture not in arch_performance:
-                arch_performance[result.architecture] = []
-            arch_performance[result.architecture].append(result.average_time_us)
+        arch_performance = arch_times if arch_times is not None else _architecture_times(results)
         
         if len(arch_performance) > 1:
-            arch_averages = {arch: statistics.mean(times) for arch, times in arch_performance.items()}
+            arch_averages = {arch: statistics.fmean(times) for arch, times in arch_performance.items()}
             best_arch = min(arch_averages, key=arch_averages.get)
             
             recommendations.append(
@@ -382,17 +658,25 @@ class PerformanceAnalyzer:
             )
         
         # Entity scaling recommendations
-        entity_counts = sorted(set(r.entity_count for r in results if r.entity_count > 0))
+        if entity_counts is None:
+            entity_counts = sorted(set(r.entity_count for r in results if r.entity_count > 0))
         if len(entity_counts) > 2:
-            large_scale_results = [r for r in results if r.entity_count >= max(entity_counts) * 0.8]
-            if large_scale_results:
-                avg_large_scale_time = statistics.mean(r.average_time_us for r in large_scale_results)
-                small_scale_results = [r for r in results if r.entity_count <= min(entity_counts) * 1.2]
-                avg_small_scale_time = statistics.mean(r.average_time_us for r in small_scale_results)
+            # The counts are sorted, so the extremes are the ends of the list
+            min_entities = entity_counts[0]
+            max_entities = entity_counts[-1]
+            large_scale_cutoff = max_entities * 0.8
+            small_scale_cutoff = min_entities * 1.2
+            if columns is not None:
+                large_scale_times = columns['time'][columns['ent'] >= large_scale_cutoff]
+                small_scale_times = columns['time'][columns['ent'] <= small_scale_cutoff]
+            else:
+                large_scale_times = [r.average_time_us for r in results if r.entity_count >= large_scale_cutoff]
+                small_scale_times = [r.average_time_us for r in results if r.entity_count <= small_scale_cutoff]
+            if len(large_scale_times):
+                avg_large_scale_time = _mean(large_scale_times)
+                avg_small_scale_time = _mean(small_scale_times)
                 
                 scaling_factor = avg_large_scale_time / avg_small_scale_time
-                max_entities = max(entity_counts)
-                min_entities = min(entity_counts)
                 
                 if scaling_factor > (max_entities / min_entities):
                     recommendations.append(
@@ -413,11 +697,18 @@ class PerformanceAnalyzer:
     
     def run_analysis(self, current_files: List[str], baseline_file: Optional[str] = None) -> PerformanceAnalysis:
         """Run complete performance analysis"""
-        # Load current results
+        # Load current results, parsing several files side by side when the
+        # machine has the cores for it; map keeps the command-line order
         self.current_results = []
-        for file_path in current_files:
-            results = self.load_results(file_path)
-            self.current_results.extend(results)
+        workers = min(len(current_files), os.cpu_count() or 1)
+        if workers > 1:
+            sys.stdout.flush()  # forked workers must not inherit unflushed output
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for results in executor.map(_load_results_worker, current_files):
+                    self.current_results.extend(results)
+        else:
+            for file_path in current_files:
+                self.current_results.extend(self.load_results(file_path))
         
         if not self.current_results:
             raise ValueError("No current performance results found")
@@ -426,31 +717,54 @@ class PerformanceAnalyzer:
         regressions = []
         improvements = []
         if baseline_file and os.path.exists(baseline_file):
-            self.baseline_results = self.load_results(baseline_file)
+            self.baseline_results = list(self.load_results(baseline_file))
             if self.baseline_results:
                 regressions, improvements = self.detect_regressions(self.baseline_results, self.current_results)
         
+        # Group the current results once for the summary and the helpers below
+        arch_times = defaultdict(list)
+        categories = set()
+        entity_counts = set()
+        platforms = set()
+        times = []
+        for result in self.current_results:
+            times.append(result.average_time_us)
+            arch_times[result.architecture].append(result.average_time_us)
+            categories.add(result.category)
+            if result.entity_count > 0:
+                entity_counts.add(result.entity_count)
+            if result.platform != "unknown":
+                platforms.add(result.platform)
+        
+        entity_counts = sorted(entity_counts)
+        
+        # Columnar copy of the numeric fields shared by every pass below
+        self._cols = _result_columns(self.current_results)
+        
         # Generate analysis components
-        memory_analysis = self.analyze_memory_performance(self.current_results)
-        educational_insights = self.generate_educational_insights(self.current_results, regressions, improvements)
+        memory_analysis = self.analyze_memory_performance(self.current_results, self._cols)
+        educational_insights = self.generate_educational_insights(
+            self.current_results, regressions, improvements, arch_times, self._cols, entity_counts)
         optimization_recommendations = self.generate_optimization_recommendations(
-            self.current_results, regressions, memory_analysis)
+            self.current_results, regressions, memory_analysis, arch_times, self._cols, entity_counts)
+        
+        average_performance, performance_variance = _mean_stdev(
+            self._cols['time'] if self._cols is not None else times)
         
         # Generate summary statistics
         summary = {
             "total_tests": len(self.current_results),
-            "test_categories": len(set(r.category for r in self.current_results)),
-            "architectures_tested": len(set(r.architecture for r in self.current_results)),
-            "entity_counts_tested": sorted(set(r.entity_count for r in self.current_results if r.entity_count > 0)),
-            "average_performance_us": statistics.mean(r.average_time_us for r in self.current_results),
-            "performance_variance": statistics.stdev(r.average_time_us for r in self.current_results) if len(self.current_results) > 1 else 0,
+            "test_categories": len(categories),
+            "architectures_tested": len(arch_times),
+            "entity_counts_tested": entity_counts,
+            "average_performance_us": average_performance,
+            "performance_variance": performance_variance,
             "regressions_detected": len(regressions),
             "improvements_detected": len(improvements),
             "has_baseline": baseline_file is not None and len(self.baseline_results) > 0
         }
         
         # Cross-platform analysis (simplified)
-        platforms = set(r.platform for r in self.current_results if r.platform != "unknown")
         cross_platform_analysis = {
             "platforms_tested": list(platforms),
             "platform_count": len(platforms)
@@ -469,80 +783,92 @@ class PerformanceAnalyzer:
     
     def export_analysis(self, analysis: PerformanceAnalysis, output_file: str):
         """Export analysis results to JSON"""
-        with open(output_file, 'w') as f:
-            json.dump(asdict(analysis), f, indent=2, default=str)
+        if orjson is not None:
+            # orjson walks dataclasses natively, so skip the asdict() deep copy
+            payload = orjson.dumps(analysis, default=str, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(asdict(analysis), indent=2, default=str).encode('utf-8')
+        with open(output_file, 'wb') as f:
+            f.write(payload)
         print(f"Analysis exported to {output_file}")
     
     def generate_report(self, analysis: PerformanceAnalysis, report_file: str):
         """Generate markdown performance report"""
+        # Assemble the whole report in memory and hand it to the file in one write
+        parts = []
+        parts.append("# ECScope Performance Analysis Report\n\n")
+        parts.append(f"Generated: {analysis.timestamp}\n\n")
+        
+        # Executive Summary
+        parts.append("## Executive Summary\n\n")
+        parts.append(f"- **Total Tests Analyzed**: {analysis.summary['total_tests']}\n")
+        parts.append(f"- **Test Categories**: {analysis.summary['test_categories']}\n")
+        parts.append(f"- **Architectures Tested**: {analysis.summary['architectures_tested']}\n")
+        parts.append(f"- **Performance Regressions**: {analysis.summary['regressions_detected']}\n")
+        parts.append(f"- **Performance Improvements**: {analysis.summary['improvements_detected']}\n")
+        parts.append(f"- **Average Performance**: {analysis.summary['average_performance_us']:.2f} μs\n\n")
+        
+        # Regressions
+        if analysis.regressions:
+            parts.append("## Performance Regressions\n\n")
+            parts.append("| Test Name | Baseline (μs) | Current (μs) | Change (%) | Confidence |\n")
+            parts.append("|-----------|---------------|--------------|------------|------------|\n")
+            parts.extend(_REPORT_ROW(reg, "+", reg.change_percentage*100, reg.confidence_level*100)
+                         for reg in analysis.regressions[:10])  # Top 10
+            parts.append("\n")
+        
+        # Improvements
+        if analysis.improvements:
+            parts.append("## Performance Improvements\n\n")
+            parts.append("| Test Name | Baseline (μs) | Current (μs) | Change (%) | Confidence |\n")
+            parts.append("|-----------|---------------|--------------|------------|------------|\n")
+            parts.extend(_REPORT_ROW(imp, "", imp.change_percentage*100, imp.confidence_level*100)
+                         for imp in analysis.improvements[:10])  # Top 10
+            parts.append("\n")
+        
+        # Memory Analysis
+        if analysis.memory_analysis:
+            parts.append("## Memory Analysis\n\n")
+            mem = analysis.memory_analysis
+            if "average_memory_usage" in mem:
+                parts.append(f"- **Average Memory Usage**: {mem['average_memory_usage']:,.0f} bytes\n")
+                parts.append(f"- **Peak Memory Usage**: {mem['max_memory_usage']:,} bytes\n")
+            if "average_memory_per_entity" in mem:
+                parts.append(f"- **Memory per Entity**: {mem['average_memory_per_entity']:.2f} bytes\n")
+            if "average_cache_hit_ratio" in mem:
+                parts.append(f"- **Cache Hit Ratio**: {mem['average_cache_hit_ratio']*100:.1f}%\n")
+            parts.append("\n")
+        
+        # Educational Insights
+        parts.append("## Educational Insights\n\n")
+        parts.extend(f"{i}. {insight}\n\n" for i, insight in enumerate(analysis.educational_insights, 1))
+        
+        # Optimization Recommendations
+        parts.append("## Optimization Recommendations\n\n")
+        parts.extend(f"{i}. {rec}\n\n" for i, rec in enumerate(analysis.optimization_recommendations, 1))
+        
+        # Technical Details
+        parts.append("## Technical Details\n\n")
+        if analysis.summary["entity_counts_tested"]:
+            entity_counts = analysis.summary["entity_counts_tested"]
+            parts.append(f"- **Entity Counts Tested**: {', '.join(map(str, entity_counts))}\n")
+        parts.append(f"- **Performance Variance**: {analysis.summary['performance_variance']:.2f} μs\n")
+        if analysis.cross_platform_analysis["platforms_tested"]:
+            platforms = ", ".join(analysis.cross_platform_analysis["platforms_tested"])
+            parts.append(f"- **Platforms**: {platforms}\n")
+        
         with open(report_file, 'w') as f:
-            f.write("# ECScope Performance Analysis Report\n\n")
-            f.write(f"Generated: {analysis.timestamp}\n\n")
-            
-            # Executive Summary
-            f.write("## Executive Summary\n\n")
-            f.write(f"- **Total Tests Analyzed**: {analysis.summary['total_tests']}\n")
-            f.write(f"- **Test Categories**: {analysis.summary['test_categories']}\n")
-            f.write(f"- **Architectures Tested**: {analysis.summary['architectures_tested']}\n")
-            f.write(f"- **Performance Regressions**: {analysis.summary['regressions_detected']}\n")
-            f.write(f"- **Performance Improvements**: {analysis.summary['improvements_detected']}\n")
-            f.write(f"- **Average Performance**: {analysis.summary['average_performance_us']:.2f} μs\n\n")
-            
-            # Regressions
-            if analysis.regressions:
-                f.write("## Performance Regressions\n\n")
-                f.write("| Test Name | Baseline (μs) | Current (μs) | Change (%) | Confidence |\n")
-                f.write("|-----------|---------------|--------------|------------|------------|\n")
-                for reg in analysis.regressions[:10]:  # Top 10
-                    f.write(f"| {reg.test_name} | {reg.baseline_performance:.2f} | {reg.current_performance:.2f} | "
-                           f"+{reg.change_percentage*100:.1f}% | {reg.confidence_level*100:.0f}% |\n")
-                f.write("\n")
-            
-            # Improvements
-            if analysis.improvements:
-                f.write("## Performance Improvements\n\n")
-                f.write("| Test Name | Baseline (μs) | Current (μs) | Change (%) | Confidence |\n")
-                f.write("|-----------|---------------|--------------|------------|------------|\n")
-                for imp in analysis.improvements[:10]:  # Top 10
-                    f.write(f"| {imp.test_name} | {imp.baseline_performance:.2f} | {imp.current_performance:.2f} | "
-                           f"{imp.change_percentage*100:.1f}% | {imp.confidence_level*100:.0f}% |\n")
-                f.write("\n")
-            
-            # Memory Analysis
-            if analysis.memory_analysis:
-                f.write("## Memory Analysis\n\n")
-                mem = analysis.memory_analysis
-                if "average_memory_usage" in mem:
-                    f.write(f"- **Average Memory Usage**: {mem['average_memory_usage']:,.0f} bytes\n")
-                    f.write(f"- **Peak Memory Usage**: {mem['max_memory_usage']:,} bytes\n")
-                if "average_memory_per_entity" in mem:
-                    f.write(f"- **Memory per Entity**: {mem['average_memory_per_entity']:.2f} bytes\n")
-                if "average_cache_hit_ratio" in mem:
-                    f.write(f"- **Cache Hit Ratio**: {mem['average_cache_hit_ratio']*100:.1f}%\n")
-                f.write("\n")
-            
-            # Educational Insights
-            f.write("## Educational Insights\n\n")
-            for i, insight in enumerate(analysis.educational_insights, 1):
-                f.write(f"{i}. {insight}\n\n")
-            
-            # Optimization Recommendations
-            f.write("## Optimization Recommendations\n\n")
-            for i, rec in enumerate(analysis.optimization_recommendations, 1):
-                f.write(f"{i}. {rec}\n\n")
-            
-            # Technical Details
-            f.write("## Technical Details\n\n")
-            if analysis.summary["entity_counts_tested"]:
-                entity_counts = analysis.summary["entity_counts_tested"]
-                f.write(f"- **Entity Counts Tested**: {', '.join(map(str, entity_counts))}\n")
-            f.write(f"- **Performance Variance**: {analysis.summary['performance_variance']:.2f} μs\n")
-            if analysis.cross_platform_analysis["platforms_tested"]:
-                platforms = ", ".join(analysis.cross_platform_analysis["platforms_tested"])
-                f.write(f"- **Platforms**: {platforms}\n")
+            f.write(''.join(parts))
         
         print(f"Report generated: {report_file}")
 
+def _load_results_worker(file_path: str) -> List[PerformanceResult]:
+    """Load one results file in a worker process"""
+    try:
+        return list(PerformanceAnalyzer().load_results(file_path))
+    finally:
+        sys.stdout.flush()
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze ECScope performance benchmark results')
     parser.add_argument('--current', nargs='+', required=True, help='Current benchmark result files')
@@ -550,6 +876,8 @@ def main():
     parser.add_argument('--output', required=True, help='Output analysis file (JSON)')
     parser.add_argument('--report', help='Output report file (Markdown)')
     parser.add_argument('--threshold', type=float, default=0.05, help='Regression threshold (default: 0.05)')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Exit with status 1 as soon as regressions are found, without writing the JSON or report')
     
     args = parser.parse_args()
     
@@ -561,6 +889,11 @@ def main():
         print("Running performance analysis...")
         analysis = analyzer.run_analysis(args.current, args.baseline)
         
+        # The job is going to fail anyway, so skip the output files
+        if args.fail_fast and analysis.summary['regressions_detected'] > 0:
+            print(f"\nWarning: {analysis.summary['regressions_detected']} performance regressions detected")
+            exit(1)
+        
         # Export results
         analyzer.export_analysis(analysis, args.output)
         
@@ -9,13 +9,44 @@ import os
 import sys
 import glob
 import argparse
+from array import array
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 import statistics
 import datetime
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib json module
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional, the benchmark statistics fall back to a Python loop
+    np = None
+
+def _parse_json(data: bytes) -> Any:
+    """Parse a raw JSON buffer, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; the stdlib parser also accepts the
+            # NaN/Infinity literals some test harnesses emit
+            pass
+    return json.loads(data)
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, stringifying anything unknown"""
+    if orjson is not None:
+        # Dataclasses go through default=str as well, like json.dumps does
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2
+                            | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+@dataclass(slots=True)
 class TestResult:
     name: str
     status: str  # "passed", "failed", "skipped"
@@ -24,7 +55,7 @@ class TestResult:
     output: str = ""
     error_message: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     name: str
     average_time_ns: int
@@ -34,7 +65,7 @@ class BenchmarkResult:
     iterations: int
     memory_usage_bytes: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     test_suite: str
     total_tests: int
@@ -43,7 +74,7 @@ class PerformanceMetrics:
     skipped_tests: int
     total_duration: float
     coverage_percentage: float = 0.0
-    benchmarks: List[BenchmarkResult] = None
+    benchmarks: List[BenchmarkResult] = field(default_factory=list)
 
 class TestResultsAnalyzer:
     def __init__(self, artifacts_dir: str):
@@ -51,123 +82,184 @@ class TestResultsAnalyzer:
         self.results: Dict[str, PerformanceMetrics] = {}
         self.test_results: List[TestResult] = []
         self.benchmarks: List[BenchmarkResult] = []
+        # Columns mirroring self.benchmarks for the vectorized summary
+        self._bench_times = array('q')
+        self._bench_memory = array('q')
 
     def analyze_artifacts(self):
         """Analyze all test artifacts in the directory."""
         print("Analyzing test artifacts...")
         
         # Find all test result files
-        test_files = list(self.artifacts_dir.glob("**/test_results_*.json"))
-        performance_files = list(self.artifacts_dir.glob("**/performance_report.json"))
-        benchmark_files = list(self.artifacts_dir.glob("**/benchmark_results.json"))
+        test_files, performance_files, benchmark_files = self._collect_artifacts()
         
         print(f"Found {len(test_files)} test result files")
         print(f"Found {len(performance_files)} performance report files")
         print(f"Found {len(benchmark_files)} benchmark result files")
         
-        # Analyze test results
-        for test_file in test_files:
-            self.analyze_test_file(test_file)
-        
-        # Analyze performance results
-        for perf_file in performance_files:
-            self.analyze_performance_file(perf_file)
-        
-        # Analyze benchmark results
-        for bench_file in benchmark_files:
-            self.analyze_benchmark_file(bench_file)
+        # Read and parse every file concurrently, then merge the results on
+        # this thread in the original order so no locking is needed
+        batches = [
+            ("test file", test_files, self._parse_test_file, self._merge_test_file),
+            ("performance file", performance_files, self._parse_performance_file, self._merge_performance_file),
+            ("benchmark file", benchmark_files, self._parse_benchmark_file, self._merge_benchmark_file),
+        ]
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            pending = [(label, path, merge, executor.submit(parse, path))
+                       for label, paths, parse, merge in batches for path in paths]
+            for label, path, merge, future in pending:
+                try:
+                    merge(future.result())
+                except Exception as e:
+                    print(f"Error analyzing {label} {path}: {e}")
+
+    def _collect_artifacts(self) -> Tuple[List[str], List[str], List[str]]:
+        """Classify the artifact files in a single walk of the directory tree."""
+        test_files = []
+        performance_files = []
+        benchmark_files = []
+        for dirpath, _, filenames in os.walk(self.artifacts_dir):
+            for name in filenames:
+                if name.startswith('test_results_') and name.endswith('.json'):
+                    test_files.append(os.path.join(dirpath, name))
+                elif name == 'performance_report.json':
+                    performance_files.append(os.path.join(dirpath, name))
+                elif name == 'benchmark_results.json':
+                    benchmark_files.append(os.path.join(dirpath, name))
+        return test_files, performance_files, benchmark_files
 
     def analyze_test_file(self, test_file: Path):
         """Analyze a single test results file."""
         try:
-            with open(test_file, 'r') as f:
-                data = json.load(f)
-            
-            suite_name = data.get('suite_name', test_file.stem)
-            
-            metrics = PerformanceMetrics(
-                test_suite=suite_name,
-                total_tests=data.get('total_tests', 0),
-                passed_tests=data.get('passed_tests', 0),
-                failed_tests=data.get('failed_tests', 0),
-                skipped_tests=data.get('skipped_tests', 0),
-                total_duration=data.get('total_duration_seconds', 0.0),
-                coverage_percentage=data.get('coverage_percentage', 0.0)
-            )
-            
-            self.results[suite_name] = metrics
-            
-            # Extract individual test results
-            for test_data in data.get('tests', []):
-                test_result = TestResult(
-                    name=test_data.get('name', ''),
-                    status=test_data.get('status', 'unknown'),
-                    duration_seconds=test_data.get('duration_seconds', 0.0),
-                    category=test_data.get('category', 'unknown'),
-                    output=test_data.get('output', ''),
-                    error_message=test_data.get('error_message', '')
-                )
-                self.test_results.append(test_result)
-            
+            self._merge_test_file(self._parse_test_file(test_file))
         except Exception as e:
             print(f"Error analyzing test file {test_file}: {e}")
 
     def analyze_performance_file(self, perf_file: Path):
         """Analyze a performance report file."""
         try:
-            with open(perf_file, 'r') as f:
-                data = json.load(f)
-            
-            # Extract system information
-            system_info = data.get('system_info', {})
-            print(f"Performance test system: {system_info}")
-            
-            # Extract performance test results
-            for test_result in data.get('test_results', []):
-                bench_result = BenchmarkResult(
-                    name=test_result.get('test_name', ''),
-                    average_time_ns=test_result.get('average_time_ns', 0),
-                    min_time_ns=test_result.get('min_time_ns', 0),
-                    max_time_ns=test_result.get('max_time_ns', 0),
-                    std_deviation_ns=test_result.get('std_deviation_ns', 0),
-                    iterations=test_result.get('iterations', 0),
-                    memory_usage_bytes=test_result.get('memory_usage_bytes', 0)
-                )
-                self.benchmarks.append(bench_result)
-                
+            self._merge_performance_file(self._parse_performance_file(perf_file))
         except Exception as e:
             print(f"Error analyzing performance file {perf_file}: {e}")
 
     def analyze_benchmark_file(self, bench_file: Path):
         """Analyze a benchmark results file."""
         try:
-            with open(bench_file, 'r') as f:
-                data = json.load(f)
-            
-            for benchmark_data in data.get('benchmarks', []):
-                bench_result = BenchmarkResult(
-                    name=benchmark_data.get('name', ''),
-                    average_time_ns=benchmark_data.get('average_time_ns', 0),
-                    min_time_ns=benchmark_data.get('min_time_ns', 0),
-                    max_time_ns=benchmark_data.get('max_time_ns', 0),
-                    std_deviation_ns=benchmark_data.get('std_deviation_ns', 0),
-                    iterations=benchmark_data.get('iterations', 0),
-                    memory_usage_bytes=benchmark_data.get('memory_usage_bytes', 0)
-                )
-                self.benchmarks.append(bench_result)
-                
+            self._merge_benchmark_file(self._parse_benchmark_file(bench_file))
         except Exception as e:
             print(f"Error analyzing benchmark file {bench_file}: {e}")
 
+    @staticmethod
+    def _parse_test_file(test_file: Path) -> Tuple[PerformanceMetrics, List[TestResult]]:
+        """Read a test results file into its suite metrics and individual results."""
+        with open(test_file, 'rb') as f:
+            data = _parse_json(f.read())
+        
+        suite_name = data.get('suite_name', os.path.splitext(os.path.basename(test_file))[0])
+        
+        metrics = PerformanceMetrics(
+            test_suite=suite_name,
+            total_tests=data.get('total_tests', 0),
+            passed_tests=data.get('passed_tests', 0),
+            failed_tests=data.get('failed_tests', 0),
+            skipped_tests=data.get('skipped_tests', 0),
+            total_duration=data.get('total_duration_seconds', 0.0),
+            coverage_percentage=data.get('coverage_percentage', 0.0)
+        )
+        
+        # Extract individual test results
+        test_results = [
+            TestResult(
+                name=test_data.get('name', ''),
+                status=test_data.get('status', 'unknown'),
+                duration_seconds=test_data.get('duration_seconds', 0.0),
+                category=test_data.get('category', 'unknown'),
+                output=test_data.get('output', ''),
+                error_message=test_data.get('error_message', '')
+            )
+            for test_data in data.get('tests', [])
+        ]
+        return metrics, test_results
+
+    @staticmethod
+    def _parse_performance_file(perf_file: Path) -> Tuple[Dict[str, Any], List[BenchmarkResult]]:
+        """Read a performance report into its system information and benchmarks."""
+        with open(perf_file, 'rb') as f:
+            data = _parse_json(f.read())
+        
+        # Extract performance test results
+        benchmarks = [
+            BenchmarkResult(
+                name=test_result.get('test_name', ''),
+                average_time_ns=test_result.get('average_time_ns', 0),
+                min_time_ns=test_result.get('min_time_ns', 0),
+                max_time_ns=test_result.get('max_time_ns', 0),
+                std_deviation_ns=test_result.get('std_deviation_ns', 0),
+                iterations=test_result.get('iterations', 0),
+                memory_usage_bytes=test_result.get('memory_usage_bytes', 0)
+            )
+            for test_result in data.get('test_results', [])
+        ]
+        return data.get('system_info', {}), benchmarks
+
+    @staticmethod
+    def _parse_benchmark_file(bench_file: Path) -> List[BenchmarkResult]:
+        """Read a benchmark results file."""
+        with open(bench_file, 'rb') as f:
+            data = _parse_json(f.read())
+        
+        return [
+            BenchmarkResult(
+                name=benchmark_data.get('name', ''),
+                average_time_ns=benchmark_data.get('average_time_ns', 0),
+                min_time_ns=benchmark_data.get('min_time_ns', 0),
+                max_time_ns=benchmark_data.get('max_time_ns', 0),
+                std_deviation_ns=benchmark_data.get('std_deviation_ns', 0),
+                iterations=benchmark_data.get('iterations', 0),
+                memory_usage_bytes=benchmark_data.get('memory_usage_bytes', 0)
+            )
+            for benchmark_data in data.get('benchmarks', [])
+        ]
+
+    def _merge_test_file(self, parsed: Tuple[PerformanceMetrics, List[TestResult]]):
+        """Record a parsed test results file."""
+        metrics, test_results = parsed
+        self.results[metrics.test_suite] = metrics
+        self.test_results.extend(test_results)
+
+    def _merge_performance_file(self, parsed: Tuple[Dict[str, Any], List[BenchmarkResult]]):
+        """Record a parsed performance report."""
+        system_info, benchmarks = parsed
+        print(f"Performance test system: {system_info}")
+        self._record_benchmarks(benchmarks)
+
+    def _merge_benchmark_file(self, benchmarks: List[BenchmarkResult]):
+        """Record a parsed benchmark results file."""
+        self._record_benchmarks(benchmarks)
+
+    def _record_benchmarks(self, benchmarks: List[BenchmarkResult]):
+        """Append benchmarks and mirror their time and memory into the columns."""
+        self.benchmarks.extend(benchmarks)
+        try:
+            self._bench_times.extend([b.average_time_ns for b in benchmarks])
+            self._bench_memory.extend([b.memory_usage_bytes for b in benchmarks])
+        except (TypeError, OverflowError):
+            pass  # Non-integer fields leave the columns short; the summary then loops
+
     def generate_summary(self) -> Dict[str, Any]:
         """Generate a comprehensive summary of all test results."""
-        total_tests = sum(metrics.total_tests for metrics in self.results.values())
-        total_passed = sum(metrics.passed_tests for metrics in self.results.values())
-        total_failed = sum(metrics.failed_tests for metrics in self.results.values())
-        total_skipped = sum(metrics.skipped_tests for metrics in self.results.values())
+        # Totals and reported coverages in a single pass over the suites
+        total_tests = total_passed = total_failed = total_skipped = 0
+        coverages = []
+        for metrics in self.results.values():
+            total_tests += metrics.total_tests
+            total_passed += metrics.passed_tests
+            total_failed += metrics.failed_tests
+            total_skipped += metrics.skipped_tests
+            if metrics.coverage_percentage > 0:
+                coverages.append(metrics.coverage_percentage)
         
         # Calculate average coverage
-        coverages = [m.coverage_percentage for m in self.results.values() if m.coverage_percentage > 0]
         avg_coverage = statistics.mean(coverages) if coverages else 0.0
         
         # Analyze failure patterns
@@ -178,13 +270,40 @@ class TestResultsAnalyzer:
         
         # Performance analysis
         performance_summary = {}
-        if self.benchmarks:
+        if self.benchmarks and np is not None and \
+                len(self._bench_times) == len(self._bench_memory) == len(self.benchmarks):
+            # Zero-copy int64 views of the columns; argmin/argmax return the
+            # first match, so ties resolve like min()/max(). Sums stay exact
+            # integers and the mean divides them like the loop below does
+            times = np.frombuffer(self._bench_times, dtype=np.int64)
+            memory = np.frombuffer(self._bench_memory, dtype=np.int64)
+            
+            performance_summary = {
+                'total_benchmarks': len(self.benchmarks),
+                'fastest_test': self.benchmarks[int(times.argmin())],
+                'slowest_test': self.benchmarks[int(times.argmax())],
+                'average_execution_time_ns': int(times.sum(dtype=np.int64)) / len(self.benchmarks),
+                'total_memory_usage': int(memory.sum(dtype=np.int64))
+            }
+        elif self.benchmarks:
+            # Extremes, total time and total memory in one pass; the first
+            # benchmark wins ties, as with min()/max()
+            fastest = slowest = self.benchmarks[0]
+            total_time = total_memory = 0
+            for bench in self.benchmarks:
+                if bench.average_time_ns < fastest.average_time_ns:
+                    fastest = bench
+                elif bench.average_time_ns > slowest.average_time_ns:
+                    slowest = bench
+                total_time += bench.average_time_ns
+                total_memory += bench.memory_usage_bytes
+            
             performance_summary = {
                 'total_benchmarks': len(self.benchmarks),
-                'fastest_test': min(self.benchmarks, key=lambda x: x.average_time_ns),
-                'slowest_test': max(self.benchmarks, key=lambda x: x.average_time_ns),
-                'average_execution_time_ns': statistics.mean([b.average_time_ns for b in self.benchmarks]),
-                'total_memory_usage': sum([b.memory_usage_bytes for b in self.benchmarks])
+                'fastest_test': fastest,
+                'slowest_test': slowest,
+                'average_execution_time_ns': total_time / len(self.benchmarks),
+                'total_memory_usage': total_memory
             }
         
         return {
@@ -224,8 +343,8 @@ class TestResultsAnalyzer:
             return regressions
         
         try:
-            with open(baseline_file, 'r') as f:
-                baseline_data = json.load(f)
+            with open(baseline_file, 'rb') as f:
+                baseline_data = _parse_json(f.read())
             
             baseline_benchmarks = {b['name']: b for b in baseline_data.get('benchmarks', [])}
             
@@ -256,8 +375,8 @@ class TestResultsAnalyzer:
         summary = self.generate_summary()
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            with open(output_file, 'wb') as f:
+                f.write(_dump_json(summary))
             print(f"Analysis saved to {output_file}")
         except Exception as e:
             print(f"Error saving analysis: {e}")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/analyze_performance_results.py
+
+Checks that the streaming benchmark parser gives the same records as the
+buffered parse and that a file only contributes once it parsed completely.
+Run with:
+    python -m unittest discover -s scripts/tests
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import analyze_performance_results as perf
+
+RECORD = {"name": "ecs_iteration", "architecture": "Archetype", "entity_count": 100,
+          "real_time": 1.5, "stddev": 0.25, "memory_usage": 4096}
+
+def _record(i: int) -> dict:
+    return dict(RECORD, name=f"ecs_iteration_{i}", entity_count=100 * i)
+
+# Every container layout load_results accepts
+DOCUMENTS = {
+    "array": [_record(i) for i in range(3)],
+    "benchmarks": {"context": {"host": "ci"}, "benchmarks": [_record(i) for i in range(3)]},
+    "results": {"results": [_record(i) for i in range(2)], "meta": [1, 2]},
+    "results_before_benchmarks": {"results": [_record(9)], "benchmarks": [_record(1)]},
+    "single_record": _record(7),
+    "scalar_items": {"benchmarks": [1, "two", None]},
+}
+
+def _json_bytes(doc) -> bytes:
+    return json.dumps(doc).encode()
+
+@unittest.skipIf(perf.ijson is None, "ijson not installed")
+class StreamingParserTest(unittest.TestCase):
+    def assertMatchesBuffered(self, data: bytes):
+        streamed = list(perf._stream_benchmark_items(io.BytesIO(data)))
+        buffered = perf._benchmark_items(perf._parse_json(data))
+        # Compare serialized forms so NaN equals NaN
+        self.assertEqual(json.dumps(streamed), json.dumps(buffered))
+
+    def test_layouts_match_buffered_parse(self):
+        for name, doc in DOCUMENTS.items():
+            with self.subTest(layout=name):
+                self.assertMatchesBuffered(_json_bytes(doc))
+
+    def test_nan_after_streamed_records(self):
+        records = [_record(i) for i in range(3)]
+        records[-1]["stddev"] = float("nan")
+        self.assertMatchesBuffered(_json_bytes({"benchmarks": records}))
+
+class LoadResultsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.analyzer = perf.PerformanceAnalyzer()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_complete_file(self):
+        path = self._write("ok.json", _json_bytes(DOCUMENTS["benchmarks"]))
+        results = list(self.analyzer.load_results(path))
+        self.assertEqual([r.test_name for r in results],
+                         [f"ecs_iteration_{i}" for i in range(3)])
+        self.assertEqual(results[0].average_time_us, 1.5)
+
+    def test_truncated_file_contributes_nothing(self):
+        data = _json_bytes({"benchmarks": [_record(i) for i in range(50)]})
+        path = self._write("truncated.json", data[:len(data) // 2])
+        with mock.patch('builtins.print') as printed:
+            self.assertEqual(list(self.analyzer.load_results(path)), [])
+        self.assertIn("truncated.json", printed.call_args[0][0])
+
+    def test_missing_file_contributes_nothing(self):
+        with mock.patch('builtins.print'):
+            missing = os.path.join(self.tmp.name, "missing.json")
+            self.assertEqual(list(self.analyzer.load_results(missing)), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/analyze_test_results.py
+
+Checks that the vectorized benchmark summary gives the same answers as the
+plain looping code path. Run with:
+    python -m unittest discover -s scripts/tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import analyze_test_results as test_results
+
+@unittest.skipIf(test_results.np is None, "numpy not installed")
+class GenerateSummaryTest(unittest.TestCase):
+    def _analyzer(self, *batches) -> test_results.TestResultsAnalyzer:
+        analyzer = test_results.TestResultsAnalyzer(tempfile.gettempdir())
+        for batch in batches:
+            analyzer._record_benchmarks([
+                test_results.BenchmarkResult(name=f"bench_{i}", average_time_ns=time_ns,
+                                             min_time_ns=0, max_time_ns=0, std_deviation_ns=0,
+                                             iterations=1, memory_usage_bytes=memory)
+                for i, (time_ns, memory) in enumerate(batch)
+            ])
+        return analyzer
+
+    def assertMatchesLoop(self, analyzer: test_results.TestResultsAnalyzer):
+        vectorized = analyzer.generate_summary()['performance']
+        with mock.patch.object(test_results, 'np', None):
+            looped = analyzer.generate_summary()['performance']
+        self.assertEqual(vectorized, looped)
+        # Both paths keep integer inputs as exact integers
+        self.assertEqual(type(vectorized['total_memory_usage']), type(looped['total_memory_usage']))
+
+    def test_ties_and_batches(self):
+        # Repeated extremes: the first occurrence wins on both paths
+        self.assertMatchesLoop(self._analyzer([(5, 10), (1, 0), (9, 3)],
+                                              [(1, 7), (9, 1), (4, 2)]))
+
+    def test_values_beyond_float_precision(self):
+        big = 2 ** 60 + 1
+        analyzer = self._analyzer([(big, big), (3, big)])
+        self.assertMatchesLoop(analyzer)
+        self.assertEqual(analyzer.generate_summary()['performance']['total_memory_usage'], 2 * big)
+
+    def test_fractional_values_fall_back_to_loop(self):
+        analyzer = self._analyzer([(2, 1), (1.5, 2)], [(7, 3)])
+        self.assertNotEqual(len(analyzer._bench_times), len(analyzer.benchmarks))
+        self.assertMatchesLoop(analyzer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental build cache in docs/interactive/build-docs.py
+
+Covers the input-digest stamps, the outputs kept between builds and the
+streaming subprocess runners. Run with:
+    python -m unittest discover -s scripts/tests
+"""
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+BUILD_DOCS = Path(__file__).resolve().parents[2] / "docs" / "interactive" / "build-docs.py"
+
+# Writes generated/ like tools/api-doc-generator.py and counts its runs
+FAKE_GENERATOR = '''
+import sys
+from pathlib import Path
+args = sys.argv[1:]
+out = Path(args[args.index("--output") + 1])
+runs = out.parent / "generator-runs"
+runs.write_text(str(int(runs.read_text()) + 1 if runs.exists() else 1))
+print("generating")
+if (out.parent / "generator-fails").exists():
+    sys.exit(1)
+(out / "html").mkdir(parents=True, exist_ok=True)
+(out / "markdown").mkdir(parents=True, exist_ok=True)
+(out / "api.json").write_text("{}")
+(out / "html" / "index.html").write_text("<html></html>")
+(out / "markdown" / "README.md").write_text("# API")
+'''
+
+def _load_build_docs():
+    # The module opens docs-build.log in the working directory on import
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        spec = importlib.util.spec_from_file_location("build_docs", BUILD_DOCS)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        os.chdir(cwd)
+
+build_docs = _load_build_docs()
+
+class BuildCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for directory in ("include", "examples/basics", "tools", "docs/interactive"):
+            (self.root / directory).mkdir(parents=True)
+        (self.root / "include" / "ecs.hpp").write_text("struct Entity {};\n")
+        (self.root / "examples" / "basics" / "hello.cpp").write_text(
+            "/** @brief Says hello */\nint main() {}\n")
+        (self.root / "tools" / "api-doc-generator.py").write_text(FAKE_GENERATOR)
+
+        self.builder = build_docs.DocumentationBuilder(self.root)
+        self.builder._prepare_output_directory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _generator_runs(self) -> int:
+        runs = self.builder.output_root / "generator-runs"
+        return int(runs.read_text()) if runs.exists() else 0
+
+    def test_stamp_hit_miss_and_invalidate(self):
+        output = self.builder.output_root / "generated" / "api.json"
+        self.assertFalse(self.builder._is_cached("api", "abc", output))
+
+        output.write_text("{}")
+        self.builder._store_cache("api", "abc")
+        self.assertTrue(self.builder._is_cached("api", "abc", output))
+        self.assertFalse(self.builder._is_cached("api", "def", output))
+
+        output.unlink()
+        self.assertFalse(self.builder._is_cached("api", "abc", output))
+
+        output.write_text("{}")
+        self.builder._clear_cache("api")
+        self.assertFalse(self.builder._is_cached("api", "abc", output))
+        self.builder._clear_cache("api")  # already gone
+
+    def test_prepare_output_directory_keeps_cached_outputs(self):
+        output_root = self.builder.output_root
+        for name in ("generated", "tutorials", "examples"):
+            (output_root / name / "keep.json").write_text("{}")
+        self.builder._store_cache("api", "abc")
+        (output_root / "assets" / "bundle.js").write_text("")
+        (output_root / "index.html").write_text("")
+
+        self.builder._prepare_output_directory()
+
+        for name in ("generated", "tutorials", "examples"):
+            self.assertTrue((output_root / name / "keep.json").exists())
+        self.assertTrue((self.builder.cache_dir / "api.hash").exists())
+        self.assertFalse((output_root / "assets" / "bundle.js").exists())
+        self.assertFalse((output_root / "index.html").exists())
+
+    def test_discarded_trees_leave_the_output_root(self):
+        output_root = self.builder.output_root
+        (output_root / "assets" / "nested").mkdir(parents=True)
+        (output_root / "assets" / "nested" / "bundle.js").write_text("")
+
+        thread = build_docs._discard_tree(output_root / "assets", self.builder.trash_dir)
+        self.assertFalse(any(".old-" in entry.name for entry in output_root.iterdir()))
+        self.assertFalse(self.builder.trash_dir.is_relative_to(output_root))
+        thread.join()
+        self.assertEqual(list(self.builder.trash_dir.iterdir()), [])
+
+    def test_leftovers_from_an_interrupted_build_are_swept(self):
+        leftover = self.builder.trash_dir / "assets.old-1-1"
+        (leftover / "nested").mkdir(parents=True)
+        (leftover / "nested" / "bundle.js").write_text("")
+
+        self.builder._prepare_output_directory()
+        for thread in threading.enumerate():
+            if thread.name.startswith("discard-"):
+                thread.join()
+        self.assertEqual(list(self.builder.trash_dir.iterdir()), [])
+
+    def test_api_generation_is_skipped_until_inputs_or_outputs_change(self):
+        self.assertTrue(self.builder._build_api_documentation())
+        self.assertTrue(self.builder._build_api_documentation())
+        self.assertEqual(self._generator_runs(), 1)
+
+        # A missing output file forces regeneration even though generated/ exists
+        (self.builder.output_root / "generated" / "api.json").unlink()
+        self.assertTrue(self.builder._build_api_documentation())
+        self.assertEqual(self._generator_runs(), 2)
+
+        (self.root / "include" / "ecs.hpp").write_text("struct Entity { int id; };\n")
+        self.assertTrue(self.builder._build_api_documentation())
+        self.assertEqual(self._generator_runs(), 3)
+
+    def test_failed_api_generation_leaves_no_stamp(self):
+        (self.builder.output_root / "generator-fails").write_text("")
+        self.assertFalse(self.builder._build_api_documentation())
+        self.assertFalse((self.builder.cache_dir / "api.hash").exists())
+
+        (self.builder.output_root / "generator-fails").unlink()
+        self.assertTrue(self.builder._build_api_documentation())
+        self.assertEqual(self._generator_runs(), 2)
+
+    def test_examples_are_reprocessed_only_when_changed(self):
+        index_path = self.builder.output_root / "examples" / "index.json"
+        self.assertTrue(self.builder._prepare_code_examples())
+        first = json.loads(index_path.read_text())
+        self.assertEqual([e["path"] for e in first["examples"]],
+                         [os.path.join("basics", "hello.cpp")])
+
+        self.assertTrue(self.builder._prepare_code_examples())
+        self.assertEqual(json.loads(index_path.read_text())["generated_at"], first["generated_at"])
+
+        (self.root / "examples" / "extra.cpp").write_text("int main() { return 0; }\n")
+        self.assertTrue(self.builder._prepare_code_examples())
+        second = json.loads(index_path.read_text())
+        self.assertEqual(len(second["examples"]), 2)
+        self.assertTrue((self.builder.output_root / "examples" / "extra.cpp").exists())
+
+class StreamingRunnerTest(unittest.TestCase):
+    CMD = [sys.executable, "-c", "import sys\nfor i in range(100): print(i)\nsys.exit(3)"]
+
+    def test_run_streaming_keeps_exit_code_and_tail(self):
+        returncode, tail = build_docs._run_streaming(self.CMD, tail_lines=3)
+        self.assertEqual(returncode, 3)
+        self.assertEqual(tail, "97\n98\n99")
+
+    def test_run_streaming_async_matches_sync_runner(self):
+        result = asyncio.run(build_docs._run_streaming_async(self.CMD, tail_lines=3))
+        self.assertEqual(result, build_docs._run_streaming(self.CMD, tail_lines=3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,162 +15,283 @@ Usage: python build.py [options] [targets]
 """
 
 import argparse
+import asyncio
+import hashlib
 import os
 import sys
 import subprocess
 import json
+import pickle
 import platform
+import shutil
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only mapping proxies"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+# Built once at import; shared read-only by every ECScopeBuildSystem
+_DEFAULT_CONFIG = _freeze({
+    "build_types": {
+        "debug": {
+            "cmake_build_type": "Debug",
+            "features": {
+                "ECSCOPE_ENABLE_SANITIZERS": "ON",
+                "ECSCOPE_ENABLE_COVERAGE": "ON",
+                "ECSCOPE_DEVELOPMENT_MODE": "ON"
+            }
+        },
+        "release": {
+            "cmake_build_type": "Release", 
+            "features": {
+                "ECSCOPE_ENABLE_LTO": "ON",
+                "ECSCOPE_ENABLE_ADVANCED_OPTIMIZATIONS": "ON",
+                "ECSCOPE_ENABLE_UNITY_BUILD": "ON"
+            }
+        },
+        "educational": {
+            "cmake_build_type": "RelWithDebInfo",
+            "features": {
+                "ECSCOPE_EDUCATIONAL_MODE": "ON",
+                "ECSCOPE_BUILD_EXAMPLES": "ON",
+                "ECSCOPE_BUILD_BENCHMARKS": "ON",
+                "ECSCOPE_ENABLE_INSTRUMENTATION": "ON"
+            }
+        },
+        "performance": {
+            "cmake_build_type": "Release",
+            "features": {
+                "ECSCOPE_ENABLE_LTO": "ON",
+                "ECSCOPE_ENABLE_PGO": "ON",
+                "ECSCOPE_ENABLE_ADVANCED_OPTIMIZATIONS": "ON",
+                "ECSCOPE_ENABLE_SIMD": "ON",
+                "ECSCOPE_ENABLE_AVX512": "ON"
+            }
+        },
+        "minimal": {
+            "cmake_build_type": "MinSizeRel",
+            "features": {
+                "ECSCOPE_ENABLE_GRAPHICS": "OFF",
+                "ECSCOPE_ENABLE_SCRIPTING": "OFF",
+                "ECSCOPE_BUILD_TESTS": "OFF",
+                "ECSCOPE_BUILD_EXAMPLES": "OFF"
+            }
+        }
+    },
+    "feature_presets": {
+        "full": {
+            "ECSCOPE_ENABLE_GRAPHICS": "ON",
+            "ECSCOPE_ENABLE_SIMD": "ON", 
+            "ECSCOPE_ENABLE_JOB_SYSTEM": "ON",
+            "ECSCOPE_ENABLE_3D_PHYSICS": "ON",
+            "ECSCOPE_ENABLE_2D_PHYSICS": "ON",
+            "ECSCOPE_ENABLE_SCRIPTING": "ON",
+            "ECSCOPE_ENABLE_HARDWARE_DETECTION": "ON",
+            "ECSCOPE_BUILD_TESTS": "ON",
+            "ECSCOPE_BUILD_BENCHMARKS": "ON",
+            "ECSCOPE_BUILD_EXAMPLES": "ON"
+        },
+        "core": {
+            "ECSCOPE_ENABLE_GRAPHICS": "OFF",
+            "ECSCOPE_ENABLE_SIMD": "ON",
+            "ECSCOPE_ENABLE_JOB_SYSTEM": "ON",
+            "ECSCOPE_ENABLE_3D_PHYSICS": "OFF",
+            "ECSCOPE_BUILD_TESTS": "ON"
+        },
+        "graphics": {
+            "ECSCOPE_ENABLE_GRAPHICS": "ON",
+            "ECSCOPE_ENABLE_2D_PHYSICS": "ON",
+            "ECSCOPE_BUILD_EXAMPLES": "ON"
+        }
+    },
+    "cross_compile_targets": {
+        "linux-arm64": {
+            "toolchain": "cmake/toolchains/aarch64-linux-gnu.cmake",
+            "docker_image": "ecscope-arm64-cross"
+        },
+        "android-arm64": {
+            "toolchain": "cmake/toolchains/android-arm64.cmake", 
+            "docker_image": "ecscope-android-build"
+        },
+        "windows-x64": {
+            "toolchain": "cmake/toolchains/mingw-w64.cmake",
+            "docker_image": "ecscope-mingw-cross"
+        }
+    }
+})
+
+
+# File extensions produced by each CPack generator, used to attribute the
+# output of a single multi-generator cpack run back to its generators
+PACKAGE_EXTENSIONS = {
+    'DEB': ('.deb',),
+    'RPM': ('.rpm',),
+    'TGZ': ('.tar.gz',),
+    'TXZ': ('.tar.xz',),
+    'TBZ2': ('.tar.bz2',),
+    'ZIP': ('.zip',),
+    '7Z': ('.7z',),
+    'WIX': ('.msi',),
+    'NSIS': ('.exe',),
+    'NSIS64': ('.exe',),
+    'DragNDrop': ('.dmg',),
+    'productbuild': ('.pkg',),
+}
+
+
+@lru_cache(maxsize=4)
+def _read_build_config(config_path: str, mtime_ns: int, size: int,
+                       use_sidecar: bool = True) -> Dict:
+    """Parse build_config.json, reusing a pickled sidecar when it is current"""
+    sidecar = config_path + '.cache.pkl'
+    if use_sidecar:
+        try:
+            with open(sidecar, 'rb') as f:
+                cached_mtime, cached_size, config = pickle.load(f)
+            if (cached_mtime, cached_size) == (mtime_ns, size):
+                return config
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass
+    
+    with open(config_path, 'r') as f:
+        config = json.load(f)
+    
+    if use_sidecar:
+        # Write to a temporary file first so readers never see a partial pickle
+        tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((mtime_ns, size, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    return config
+
+
+@lru_cache(maxsize=1)
+def _detect_platform() -> Tuple[str, str, str]:
+    """Platform information is fixed for the life of the process"""
+    system = platform.system().lower()
+    machine = platform.machine().lower()
+    
+    # Normalize architecture names
+    if machine in ['x86_64', 'amd64']:
+        arch = 'x64'
+    elif machine in ['i386', 'i686', 'x86']:
+        arch = 'x86'
+    elif machine in ['aarch64', 'arm64']:
+        arch = 'arm64'
+    elif machine.startswith('arm'):
+        arch = 'arm'
+    else:
+        arch = machine
+        
+    return system, arch, f"{system}-{arch}"
+
+
+def _usable_cpus() -> int:
+    """Number of CPUs this process may run on (respects affinity/cgroup limits)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=32)
+def _command_exists(command: str) -> bool:
+    """PATH lookup without spawning the command"""
+    return shutil.which(command) is not None
+
+
+@lru_cache(maxsize=1)
+def _detect_cmake_generator() -> str:
+    """Pick the best CMake generator once per process"""
+    # Check for Ninja first (fastest)
+    if _command_exists('ninja'):
+        return 'Ninja'
+    # Check for Make
+    elif _command_exists('make'):
+        return 'Unix Makefiles'
+    # Windows fallback
+    elif _detect_platform()[0] == 'windows':
+        return 'Visual Studio 16 2019'
+    else:
+        return 'Unix Makefiles'
+
+
+def _remove_tree(path: Path, max_workers: int = 8) -> None:
+    """Remove a directory tree, deleting top-level children concurrently on POSIX"""
+    if os.name != 'posix':
+        shutil.rmtree(path)
+        return
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def remove_child(child: Path) -> None:
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() propagates the first failure from any worker
+        list(executor.map(remove_child, list(path.iterdir())))
+    os.rmdir(path)
+
 
 class ECScopeBuildSystem:
     """Advanced build system for ECScope with educational features"""
     
-    def __init__(self):
+    # Compile-bound (LTO/AVX-512) configurations that benefit from a compiler cache
+    SCCACHE_BUILD_TYPES = ('release', 'performance')
+    
+    def __init__(self, use_config_cache: bool = True, use_sccache: bool = True):
         self.project_root = Path(__file__).parent.absolute()
         self.build_dir = self.project_root / "build"
+        self.use_config_cache = use_config_cache
+        self.use_sccache = use_sccache
+        # Seed fresh build directories from build/toolchain-cache*.cmake
+        self.use_toolchain_cache = True
         self.config = self.load_build_config()
+        self._cmake_args_cache: Dict[tuple, Tuple[str, ...]] = {}
         
-    def load_build_config(self) -> Dict:
-        """Load build configuration from JSON file"""
+    def load_build_config(self) -> Mapping:
+        """Load build configuration from JSON file (cached by mtime and size)"""
         config_file = self.project_root / "build_config.json"
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        return self.get_default_config()
-    
-    def get_default_config(self) -> Dict:
-        """Get default build configuration"""
-        return {
-            "build_types": {
-                "debug": {
-                    "cmake_build_type": "Debug",
-                    "features": {
-                        "ECSCOPE_ENABLE_SANITIZERS": "ON",
-                        "ECSCOPE_ENABLE_COVERAGE": "ON",
-                        "ECSCOPE_DEVELOPMENT_MODE": "ON"
-                    }
-                },
-                "release": {
-                    "cmake_build_type": "Release", 
-                    "features": {
-                        "ECSCOPE_ENABLE_LTO": "ON",
-                        "ECSCOPE_ENABLE_ADVANCED_OPTIMIZATIONS": "ON",
-                        "ECSCOPE_ENABLE_UNITY_BUILD": "ON"
-                    }
-                },
-                "educational": {
-                    "cmake_build_type": "RelWithDebInfo",
-                    "features": {
-                        "ECSCOPE_EDUCATIONAL_MODE": "ON",
-                        "ECSCOPE_BUILD_EXAMPLES": "ON",
-                        "ECSCOPE_BUILD_BENCHMARKS": "ON",
-                        "ECSCOPE_ENABLE_INSTRUMENTATION": "ON"
-                    }
-                },
-                "performance": {
-                    "cmake_build_type": "Release",
-                    "features": {
-                        "ECSCOPE_ENABLE_LTO": "ON",
-                        "ECSCOPE_ENABLE_PGO": "ON",
-                        "ECSCOPE_ENABLE_ADVANCED_OPTIMIZATIONS": "ON",
-                        "ECSCOPE_ENABLE_SIMD": "ON",
-                        "ECSCOPE_ENABLE_AVX512": "ON"
-                    }
-                },
-                "minimal": {
-                    "cmake_build_type": "MinSizeRel",
-                    "features": {
-                        "ECSCOPE_ENABLE_GRAPHICS": "OFF",
-                        "ECSCOPE_ENABLE_SCRIPTING": "OFF",
-                        "ECSCOPE_BUILD_TESTS": "OFF",
-                        "ECSCOPE_BUILD_EXAMPLES": "OFF"
-                    }
-                }
-            },
-            "feature_presets": {
-                "full": {
-                    "ECSCOPE_ENABLE_GRAPHICS": "ON",
-                    "ECSCOPE_ENABLE_SIMD": "ON", 
-                    "ECSCOPE_ENABLE_JOB_SYSTEM": "ON",
-                    "ECSCOPE_ENABLE_3D_PHYSICS": "ON",
-                    "ECSCOPE_ENABLE_2D_PHYSICS": "ON",
-                    "ECSCOPE_ENABLE_SCRIPTING": "ON",
-                    "ECSCOPE_ENABLE_HARDWARE_DETECTION": "ON",
-                    "ECSCOPE_BUILD_TESTS": "ON",
-                    "ECSCOPE_BUILD_BENCHMARKS": "ON",
-                    "ECSCOPE_BUILD_EXAMPLES": "ON"
-                },
-                "core": {
-                    "ECSCOPE_ENABLE_GRAPHICS": "OFF",
-                    "ECSCOPE_ENABLE_SIMD": "ON",
-                    "ECSCOPE_ENABLE_JOB_SYSTEM": "ON",
-                    "ECSCOPE_ENABLE_3D_PHYSICS": "OFF",
-                    "ECSCOPE_BUILD_TESTS": "ON"
-                },
-                "graphics": {
-                    "ECSCOPE_ENABLE_GRAPHICS": "ON",
-                    "ECSCOPE_ENABLE_2D_PHYSICS": "ON",
-                    "ECSCOPE_BUILD_EXAMPLES": "ON"
-                }
-            },
-            "cross_compile_targets": {
-                "linux-arm64": {
-                    "toolchain": "cmake/toolchains/aarch64-linux-gnu.cmake",
-                    "docker_image": "ecscope-arm64-cross"
-                },
-                "android-arm64": {
-                    "toolchain": "cmake/toolchains/android-arm64.cmake", 
-                    "docker_image": "ecscope-android-build"
-                },
-                "windows-x64": {
-                    "toolchain": "cmake/toolchains/mingw-w64.cmake",
-                    "docker_image": "ecscope-mingw-cross"
-                }
-            }
-        }
+        try:
+            stat = config_file.stat()
+        except OSError:
+            return self.get_default_config()
+        return _read_build_config(str(config_file), stat.st_mtime_ns, stat.st_size,
+                                  self.use_config_cache)
+    
+    def get_default_config(self) -> Mapping:
+        """Get default build configuration (shared, read-only)"""
+        return _DEFAULT_CONFIG
     
     def detect_platform(self) -> Tuple[str, str, str]:
         """Detect current platform information"""
-        system = platform.system().lower()
-        machine = platform.machine().lower()
-        
-        # Normalize architecture names
-        if machine in ['x86_64', 'amd64']:
-            arch = 'x64'
-        elif machine in ['i386', 'i686', 'x86']:
-            arch = 'x86'
-        elif machine in ['aarch64', 'arm64']:
-            arch = 'arm64'
-        elif machine.startswith('arm'):
-            arch = 'arm'
-        else:
-            arch = machine
-            
-        return system, arch, f"{system}-{arch}"
+        return _detect_platform()
     
     def get_cmake_generator(self) -> str:
         """Get the best CMake generator for current platform"""
-        # Check for Ninja first (fastest)
-        if self.command_exists('ninja'):
-            return 'Ninja'
-        # Check for Make
-        elif self.command_exists('make'):
-            return 'Unix Makefiles'
-        # Windows fallback
-        elif platform.system() == 'Windows':
-            return 'Visual Studio 16 2019'
-        else:
-            return 'Unix Makefiles'
+        return _detect_cmake_generator()
     
     def command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH"""
-        try:
-            subprocess.run([command, '--version'], 
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return _command_exists(command)
     
     def run_command(self, cmd: List[str], cwd: Optional[Path] = None, 
                    check: bool = True, capture_output: bool = False) -> subprocess.CompletedProcess:
@@ -178,54 +299,266 @@ class ECScopeBuildSystem:
         print(f"Running: {' '.join(cmd)}")
         if cwd:
             print(f"Working directory: {cwd}")
+        sys.stdout.flush()
+        
+        # Stream output as it arrives instead of buffering the whole build log;
+        # only keep a copy when the caller asked for it
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        
+        with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, text=True, bufsize=1) as proc:
+            def forward_stderr():
+                for line in iter(proc.stderr.readline, ''):
+                    sys.stderr.write(line)
+                    if capture_output:
+                        stderr_lines.append(line)
             
-        return subprocess.run(
-            cmd, cwd=cwd, check=check, 
-            capture_output=capture_output, text=True
+            stderr_thread = threading.Thread(target=forward_stderr, daemon=True)
+            stderr_thread.start()
+            for line in iter(proc.stdout.readline, ''):
+                sys.stdout.write(line)
+                if capture_output:
+                    stdout_lines.append(line)
+            stderr_thread.join()
+            returncode = proc.wait()
+        
+        stdout = ''.join(stdout_lines) if capture_output else None
+        stderr = ''.join(stderr_lines) if capture_output else None
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+    
+    async def run_command_async(self, cmd: List[str], cwd: Optional[Path] = None,
+                                check: bool = True,
+                                capture_output: bool = False) -> subprocess.CompletedProcess:
+        """Asyncio variant of run_command so independent steps can overlap"""
+        print(f"Running: {' '.join(cmd)}")
+        if cwd:
+            print(f"Working directory: {cwd}")
+        sys.stdout.flush()
+        
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
-    
-    def configure_build(self, build_type: str, features: Dict[str, str],
-                       cross_compile: Optional[str] = None,
-                       generator: Optional[str] = None) -> bool:
-        """Configure CMake build"""
         
-        # Create build directory
-        build_subdir = f"build-{build_type}"
+        async def forward(stream, sink, lines: List[str]) -> None:
+            while True:
+                line = await stream.readline()
+                if not line:
+                    break
+                text = line.decode(errors='replace')
+                sink.write(text)
+                if capture_output:
+                    lines.append(text)
+        
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        await asyncio.gather(forward(proc.stdout, sys.stdout, stdout_lines),
+                             forward(proc.stderr, sys.stderr, stderr_lines))
+        returncode = await proc.wait()
+        
+        stdout = ''.join(stdout_lines) if capture_output else None
+        stderr = ''.join(stderr_lines) if capture_output else None
+        if check and returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, stdout, stderr)
+        return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+    
+    def get_build_path(self, build_type: str, cross_compile: Optional[str] = None) -> Path:
+        """Get the build directory for a configuration (build/<type>[-<cross>])"""
+        build_subdir = build_type
         if cross_compile:
             build_subdir += f"-{cross_compile}"
+        return self.build_dir / build_subdir
+    
+    def get_toolchain_cache_path(self, cross_compile: Optional[str] = None) -> Path:
+        """Get the shared compiler-detection preload for a host or cross target"""
+        if cross_compile:
+            return self.build_dir / f"toolchain-cache-{cross_compile}.cmake"
+        return self.build_dir / "toolchain-cache.cmake"
+    
+    def compiler_fingerprint(self, toolchain_digest: str = '') -> str:
+        """Digest of what compiler detection depends on: CC/CXX, PATH, the
+        binaries they resolve to and the cross toolchain file"""
+        parts = [toolchain_digest, os.environ.get('PATH', '')]
+        for var, default in (('CC', 'cc'), ('CXX', 'c++')):
+            value = os.environ.get(var, '')
+            parts.append(value)
+            compiler = shutil.which((value.split() or [default])[0])
+            if compiler:
+                # Resolve alternatives/symlinks; an upgraded compiler shows up
+                # as a new size or modification time
+                compiler = os.path.realpath(compiler)
+                st = os.stat(compiler)
+                parts.extend([compiler, str(st.st_size), str(st.st_mtime_ns)])
+        return hashlib.sha1('\0'.join(parts).encode()).hexdigest()
+    
+    def toolchain_cache_matches(self, cache_file: Path, fingerprint: str) -> bool:
+        """True when the -C preload was written for the current compiler environment"""
+        try:
+            with open(cache_file, 'r') as f:
+                return f.readline().strip() == f'# fingerprint: {fingerprint}'
+        except OSError:
+            return False
+    
+    def write_toolchain_cache(self, build_path: Path, cache_file: Path,
+                              fingerprint: str) -> None:
+        """Capture compiler detection results from CMakeCache.txt as a -C preload"""
+        cmake_cache = build_path / 'CMakeCache.txt'
+        if not cmake_cache.exists():
+            return
+        
+        entries = {}
+        with open(cmake_cache, 'r') as f:
+            for line in f:
+                name, sep, value = line.rstrip('\n').partition('=')
+                key, _, cache_type = name.partition(':')
+                if sep and key in ('CMAKE_C_COMPILER', 'CMAKE_CXX_COMPILER'):
+                    entries[key] = (cache_type or 'FILEPATH', value)
+        if not entries:
+            return
+        
+        lines = [f'# fingerprint: {fingerprint}',
+                 '# Generated by build.py from the first successful configure']
+        for key, (cache_type, value) in sorted(entries.items()):
+            lines.append(f'set({key} "{value}" CACHE {cache_type} "")')
+            lines.append(f'set({key}_WORKS TRUE CACHE INTERNAL "")')
+        
+        # Concurrent configures may race here, so never expose a partial file
+        tmp_file = cache_file.with_name(f'.{cache_file.name}.{os.getpid()}.tmp')
+        tmp_file.write_text('\n'.join(lines) + '\n')
+        os.replace(tmp_file, cache_file)
+    
+    def link_compile_commands(self, build_path: Path) -> None:
+        """Point project_root/compile_commands.json at this build, only if its content changed"""
+        compile_commands = build_path / 'compile_commands.json'
+        if not compile_commands.exists():
+            return
+        
+        digest = hashlib.sha1(compile_commands.read_bytes()).hexdigest()
+        digest_file = self.project_root / '.ecscope-ccjson.sha1'
+        link_path = self.project_root / 'compile_commands.json'
+        try:
+            if link_path.exists() and digest_file.read_text().strip() == digest:
+                # Same translation units and flags: leave the link alone so
+                # editors and clang-tidy don't re-index
+                return
+        except OSError:
+            pass
         
-        build_path = self.project_root / build_subdir
-        build_path.mkdir(parents=True, exist_ok=True)
+        tmp_link = link_path.with_name(f'.compile_commands.{os.getpid()}.tmp')
+        try:
+            os.symlink(compile_commands, tmp_link)
+            os.replace(tmp_link, link_path)
+        except OSError:
+            # Symlinks may be unavailable (e.g. unprivileged Windows)
+            shutil.copyfile(compile_commands, link_path)
+        digest_file.write_text(digest)
+    
+    def get_toolchain_path(self, cross_compile: Optional[str]) -> Optional[Path]:
+        """Get the CMake toolchain file for a cross-compile target, if it exists"""
+        if cross_compile and cross_compile in self.config['cross_compile_targets']:
+            toolchain_path = self.project_root / self.config['cross_compile_targets'][cross_compile]['toolchain']
+            if toolchain_path.exists():
+                return toolchain_path
+        return None
+    
+    def compute_cmake_args(self, build_type: str, features: FrozenSet[Tuple[str, str]],
+                           cross_compile: Optional[str], generator: str) -> Tuple[str, ...]:
+        """Build the cmake configure argv, memoized per configuration"""
+        key = (build_type, features, cross_compile, generator, self.use_sccache)
+        cached = self._cmake_args_cache.get(key)
+        if cached is not None:
+            return cached
         
-        # Prepare CMake command
         cmake_args = [
             'cmake',
             str(self.project_root),
-            f'-DCMAKE_BUILD_TYPE={self.config["build_types"][build_type]["cmake_build_type"]}'
+            f'-DCMAKE_BUILD_TYPE={self.config["build_types"][build_type]["cmake_build_type"]}',
+            '-DCMAKE_EXPORT_COMPILE_COMMANDS=ON'
         ]
         
         # Add generator
-        if not generator:
-            generator = self.get_cmake_generator()
         cmake_args.extend(['-G', generator])
         
         # Add cross-compilation toolchain
-        if cross_compile and cross_compile in self.config['cross_compile_targets']:
-            toolchain_path = self.project_root / self.config['cross_compile_targets'][cross_compile]['toolchain']
-            if toolchain_path.exists():
-                cmake_args.append(f'-DCMAKE_TOOLCHAIN_FILE={toolchain_path}')
+        toolchain_path = self.get_toolchain_path(cross_compile)
+        if toolchain_path:
+            cmake_args.append(f'-DCMAKE_TOOLCHAIN_FILE={toolchain_path}')
         
-        # Add build type features
+        # Add build type features, letting custom features override them.
+        # Sorted so the argv (and the configure stamp) is deterministic
         type_features = self.config['build_types'][build_type].get('features', {})
-        for key, value in type_features.items():
-            cmake_args.append(f'-D{key}={value}')
+        merged_features = {**type_features, **dict(features)}
+        cmake_args.extend(f'-D{key}={value}' for key, value in sorted(merged_features.items()))
         
-        # Add custom features
-        for key, value in features.items():
-            cmake_args.append(f'-D{key}={value}')
+        # Route compiles through sccache unless the caller chose a launcher
+        if (self.use_sccache and build_type in self.SCCACHE_BUILD_TYPES
+                and _command_exists('sccache')):
+            for lang in ('C', 'CXX'):
+                launcher = f'CMAKE_{lang}_COMPILER_LAUNCHER'
+                if launcher not in merged_features:
+                    cmake_args.append(f'-D{launcher}=sccache')
+        
+        cached = self._cmake_args_cache[key] = tuple(cmake_args)
+        return cached
+    
+    def configure_build(self, build_type: str, features: Dict[str, str],
+                       cross_compile: Optional[str] = None,
+                       generator: Optional[str] = None,
+                       force: bool = False) -> bool:
+        """Configure CMake build, skipping cmake when nothing has changed"""
+        
+        # Create build directory
+        build_path = self.get_build_path(build_type, cross_compile)
+        build_path.mkdir(parents=True, exist_ok=True)
+        
+        # Prepare CMake command
+        if not generator:
+            generator = self.get_cmake_generator()
+        cmake_args = self.compute_cmake_args(
+            build_type, frozenset(features.items()), cross_compile, generator
+        )
+        
+        toolchain_digest = ''
+        toolchain_path = self.get_toolchain_path(cross_compile)
+        if toolchain_path:
+            toolchain_digest = hashlib.sha1(toolchain_path.read_bytes()).hexdigest()
+        
+        # Skip cmake entirely if this exact configuration was already applied
+        stamp_file = build_path / '.ecscope-configure.stamp'
+        fingerprint = hashlib.sha256(
+            ('\0'.join(cmake_args) + f'\0{toolchain_digest}').encode()
+        ).hexdigest()
+        if not force and (build_path / 'CMakeCache.txt').exists():
+            try:
+                if stamp_file.read_text().strip() == fingerprint:
+                    print(f"✓ Configuration up to date for {build_type} build")
+                    return True
+            except OSError:
+                pass
+        
+        # Preload compiler detection results from an earlier configure on a
+        # fresh build directory (kept out of the stamp, it only seeds the
+        # cache), unless the compiler environment changed since it was written
+        toolchain_cache = self.get_toolchain_cache_path(cross_compile)
+        compiler_fingerprint = self.compiler_fingerprint(toolchain_digest)
+        toolchain_cache_valid = (self.use_toolchain_cache and
+                                 self.toolchain_cache_matches(toolchain_cache, compiler_fingerprint))
+        run_args = list(cmake_args)
+        if toolchain_cache_valid and not (build_path / 'CMakeCache.txt').exists():
+            run_args[1:1] = ['-C', str(toolchain_cache)]
+        
+        # Keep the compiler cache outside build/ so it survives --clean
+        if any(arg.endswith('_COMPILER_LAUNCHER=sccache') for arg in cmake_args):
+            os.environ.setdefault('SCCACHE_DIR', str(self.project_root / '.sccache'))
         
         try:
-            result = self.run_command(cmake_args, cwd=build_path)
+            result = self.run_command(run_args, cwd=build_path)
+            stamp_file.write_text(fingerprint)
+            if self.use_toolchain_cache and not toolchain_cache_valid:
+                self.write_toolchain_cache(build_path, toolchain_cache, compiler_fingerprint)
+            self.link_compile_commands(build_path)
             print(f"✓ Configuration successful for {build_type} build")
             return True
         except subprocess.CalledProcessError as e:
@@ -237,33 +570,41 @@ class ECScopeBuildSystem:
                      parallel_jobs: Optional[int] = None) -> bool:
         """Build specified targets"""
         
-        build_subdir = f"build-{build_type}"
-        if cross_compile:
-            build_subdir += f"-{cross_compile}"
-            
-        build_path = self.project_root / build_subdir
+        build_path = self.get_build_path(build_type, cross_compile)
         
         if not build_path.exists():
             print(f"✗ Build directory {build_path} does not exist. Run configure first.")
             return False
         
-        # Prepare build command
-        build_args = ['cmake', '--build', str(build_path)]
-        
-        if parallel_jobs:
-            build_args.extend(['--parallel', str(parallel_jobs)])
-        elif self.get_cmake_generator() == 'Ninja':
-            # Ninja auto-detects optimal parallel jobs
-            pass
+        # sccache compiles at build time, so point it at the persistent cache too
+        if self.use_sccache and build_type in self.SCCACHE_BUILD_TYPES and _command_exists('sccache'):
+            os.environ.setdefault('SCCACHE_DIR', str(self.project_root / '.sccache'))
+        
+        # Prepare build command. For Ninja trees (native builds only) call
+        # ninja directly and skip the extra `cmake --build` process layer
+        if not cross_compile and (build_path / 'build.ninja').exists() and _command_exists('ninja'):
+            build_args = ['ninja', '-C', str(build_path)]
+            if parallel_jobs:
+                # Otherwise ninja auto-detects optimal parallel jobs
+                build_args.extend(['-j', str(parallel_jobs)])
+            if targets:
+                build_args.extend(targets)
         else:
-            # Use all available cores for make
-            import multiprocessing
-            build_args.extend(['--parallel', str(multiprocessing.cpu_count())])
-        
-        # Add specific targets
-        if targets:
-            build_args.append('--target')
-            build_args.extend(targets)
+            build_args = ['cmake', '--build', str(build_path)]
+            
+            if parallel_jobs:
+                build_args.extend(['--parallel', str(parallel_jobs)])
+            elif self.get_cmake_generator() == 'Ninja':
+                # Ninja auto-detects optimal parallel jobs
+                pass
+            else:
+                # Use all usable cores for make
+                build_args.extend(['--parallel', str(_usable_cpus())])
+            
+            # Add specific targets
+            if targets:
+                build_args.append('--target')
+                build_args.extend(targets)
         
         try:
             result = self.run_command(build_args)
@@ -276,12 +617,13 @@ class ECScopeBuildSystem:
     def run_tests(self, build_type: str, test_labels: List[str] = None,
                  cross_compile: Optional[str] = None) -> bool:
         """Run tests with CTest"""
+        return asyncio.run(self.run_tests_async(build_type, test_labels, cross_compile))
+    
+    async def run_tests_async(self, build_type: str, test_labels: List[str] = None,
+                              cross_compile: Optional[str] = None) -> bool:
+        """Run tests with CTest without blocking the event loop"""
         
-        build_subdir = f"build-{build_type}"
-        if cross_compile:
-            build_subdir += f"-{cross_compile}"
-            
-        build_path = self.project_root / build_subdir
+        build_path = self.get_build_path(build_type, cross_compile)
         
         if not build_path.exists():
             print(f"✗ Build directory {build_path} does not exist")
@@ -294,7 +636,7 @@ class ECScopeBuildSystem:
                 ctest_args.extend(['-L', label])
         
         try:
-            result = self.run_command(ctest_args, cwd=build_path)
+            result = await self.run_command_async(ctest_args, cwd=build_path)
             print(f"✓ Tests passed for {build_type}")
             return True
         except subprocess.CalledProcessError as e:
@@ -303,8 +645,13 @@ class ECScopeBuildSystem:
     
     def generate_package(self, build_type: str, package_types: List[str] = None) -> bool:
         """Generate installation packages"""
+        return asyncio.run(self.generate_package_async(build_type, package_types))
+    
+    async def generate_package_async(self, build_type: str,
+                                     package_types: List[str] = None) -> bool:
+        """Generate installation packages without blocking the event loop"""
         
-        build_path = self.project_root / f"build-{build_type}"
+        build_path = self.get_build_path(build_type)
         
         if not build_path.exists():
             print(f"✗ Build directory {build_path} does not exist")
@@ -321,18 +668,35 @@ class ECScopeBuildSystem:
             else:
                 package_types = ['TGZ']
         
+        # One cpack run stages the install tree once for every generator
+        try:
+            result = await self.run_command_async([
+                'cpack', '-G', ';'.join(package_types)
+            ], cwd=build_path, check=False, capture_output=True)
+        except OSError as e:
+            print(f"✗ Package generation failed: {e}")
+            return False
+        
+        generated = [
+            line.split('package:', 1)[1].rsplit('generated', 1)[0].strip()
+            for line in result.stdout.splitlines()
+            if 'package:' in line and line.rstrip().endswith('generated.')
+        ]
+        
         success = True
         for package_type in package_types:
-            try:
-                result = self.run_command([
-                    'cpack', '-G', package_type
-                ], cwd=build_path)
+            extensions = PACKAGE_EXTENSIONS.get(package_type)
+            if extensions:
+                ok = any(path.endswith(extensions) for path in generated)
+            else:
+                ok = result.returncode == 0
+            if ok:
                 print(f"✓ {package_type} package generated")
-            except subprocess.CalledProcessError as e:
-                print(f"✗ {package_type} package failed: {e}")
+            else:
+                print(f"✗ {package_type} package failed")
                 success = False
         
-        return success
+        return success and result.returncode == 0
     
     def docker_build(self, image_type: str = 'development') -> bool:
         """Build ECScope using Docker"""
@@ -366,60 +730,78 @@ class ECScopeBuildSystem:
         """Clean build directories"""
         
         if build_type:
-            build_dirs = [self.project_root / f"build-{build_type}"]
+            build_dirs = [self.get_build_path(build_type)]
         else:
-            build_dirs = list(self.project_root.glob("build-*"))
-            build_dirs.append(self.project_root / "build")
+            # Also sweep legacy build-<type> directories from older layouts;
+            # scandir's cached d_type avoids a stat per root entry
+            try:
+                with os.scandir(self.project_root) as entries:
+                    build_dirs = [Path(entry.path) for entry in entries
+                                  if entry.name.startswith('build-')
+                                  and entry.is_dir(follow_symlinks=False)]
+            except FileNotFoundError:
+                build_dirs = []
+            build_dirs.append(self.build_dir)
         
         for build_dir in build_dirs:
             if build_dir.exists() and build_dir.is_dir():
-                import shutil
-                shutil.rmtree(build_dir)
+                _remove_tree(build_dir)
                 print(f"✓ Cleaned {build_dir}")
         
         return True
     
-    def benchmark_build_times(self, iterations: int = 3) -> Dict:
+    def benchmark_build_times(self, iterations: int = 3,
+                              parallel_jobs: Optional[int] = None,
+                              generator: Optional[str] = None) -> Dict:
         """Benchmark different build configurations"""
         
-        import time
         results = {}
         
         build_types = ['debug', 'release', 'educational']
         
-        for build_type in build_types:
-            print(f"\nBenchmarking {build_type} build...")
-            times = []
-            
-            for i in range(iterations):
-                print(f"  Iteration {i+1}/{iterations}")
-                
-                # Clean previous build
-                self.clean_build(build_type)
+        # Timed builds run one after another with this instance's options:
+        # concurrent builds would compete for the same cores and skew each
+        # other's timings. Each one also starts cold, without sccache hits
+        # or compiler detection preloaded by an earlier iteration, so the
+        # numbers for the different build types stay comparable
+        saved = (self.use_sccache, self.use_toolchain_cache)
+        self.use_sccache = self.use_toolchain_cache = False
+        try:
+            for build_type in build_types:
+                print(f"\nBenchmarking {build_type} build...")
+                times = []
                 
-                # Configure
-                start_time = time.time()
-                if not self.configure_build(build_type, {}):
-                    continue
+                for i in range(iterations):
+                    print(f"  Iteration {i+1}/{iterations}")
                     
-                # Build
-                if not self.build_targets(build_type):
-                    continue
+                    # Clean previous build
+                    self.clean_build(build_type)
                     
-                end_time = time.time()
-                build_time = end_time - start_time
-                times.append(build_time)
-                print(f"    Build time: {build_time:.2f}s")
-            
-            if times:
-                avg_time = sum(times) / len(times)
-                results[build_type] = {
-                    'times': times,
-                    'average': avg_time,
-                    'min': min(times),
-                    'max': max(times)
-                }
-                print(f"  Average time: {avg_time:.2f}s")
+                    # Configure
+                    start_time = time.time()
+                    if not self.configure_build(build_type, {}, generator=generator):
+                        continue
+                        
+                    # Build
+                    if not self.build_targets(build_type, parallel_jobs=parallel_jobs):
+                        continue
+                        
+                    end_time = time.time()
+                    build_time = end_time - start_time
+                    times.append(build_time)
+                    print(f"    Build time: {build_time:.2f}s")
+                
+                if times:
+                    avg_time = sum(times) / len(times)
+                    results[build_type] = {
+                        'times': times,
+                        'average': avg_time,
+                        'min': min(times),
+                        'max': max(times)
+                    }
+                    print(f"  Average time: {avg_time:.2f}s")
+        finally:
+            self.use_sccache, self.use_toolchain_cache = saved
         
         return results
 
@@ -487,17 +869,28 @@ Examples:
     parser.add_argument('--config-only', action='store_true',
                        help='Only configure, don\'t build')
     
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Reparse build_config.json instead of using the cached copy')
+    
+    parser.add_argument('--force-configure', action='store_true',
+                       help='Re-run CMake configure even if arguments are unchanged')
+    
+    parser.add_argument('--no-sccache', action='store_true',
+                       help='Do not use sccache as the compiler launcher for release/performance builds')
+    
     args = parser.parse_args()
     
     # Create build system instance
-    build_system = ECScopeBuildSystem()
+    build_system = ECScopeBuildSystem(use_config_cache=not args.no_cache,
+                                      use_sccache=not args.no_sccache)
     
     # Handle special commands
     if args.clean_all:
         return build_system.clean_build()
     
     if args.benchmark_builds:
-        results = build_system.benchmark_build_times()
+        results = build_system.benchmark_build_times(parallel_jobs=args.parallel,
+                                                     generator=args.generator)
         print("\nBuild Time Benchmark Results:")
         print("=" * 50)
         for build_type, data in results.items():
@@ -518,7 +911,8 @@ Examples:
     
     # Configure build
     if not build_system.configure_build(
-        args.type, features, args.cross, args.generator
+        args.type, features, args.cross, args.generator,
+        force=args.force_configure
     ):
         return False
     
@@ -529,15 +923,26 @@ Examples:
         ):
             return False
     
-    # Run tests if requested
-    if args.test:
-        if not build_system.run_tests(args.type, args.test_labels, args.cross):
-            return False
-    
-    # Generate packages if requested
-    if args.package:
-        if not build_system.generate_package(args.type, args.package_types):
+    # Tests and packaging only read the finished build, so overlap them
+    if args.test and args.package:
+        async def test_and_package():
+            return await asyncio.gather(
+                build_system.run_tests_async(args.type, args.test_labels, args.cross),
+                build_system.generate_package_async(args.type, args.package_types)
+            )
+        
+        if not all(asyncio.run(test_and_package())):
             return False
+    else:
+        # Run tests if requested
+        if args.test:
+            if not build_system.run_tests(args.type, args.test_labels, args.cross):
+                return False
+        
+        # Generate packages if requested
+        if args.package:
+            if not build_system.generate_package(args.type, args.package_types):
+                return False
     
     print(f"\n✅ ECScope build complete! Build type: {args.type}")
     return True